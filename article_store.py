@@ -0,0 +1,182 @@
+"""A persistent store of processed articles, so repeat titles skip parsing."""
+
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+from importlib import metadata
+
+import request_scheduler
+
+from lazy_import import LazyModule
+
+from validate_numbers import Validation
+
+from vocabulary import ArticleCounts, load_vocabulary
+
+np = LazyModule('numpy')
+
+# Bump this whenever Validation changes how articles are processed
+STORE_FORMAT = 3
+
+# Where processed articles are kept between games
+STORE_PATH = 'articlecache'
+
+# Set up in each worker process of the command line tools by init_worker
+WORKER = {}
+
+
+def normalise_title(title):
+    """Get the form of a title used for the store keys."""
+    return title.strip().lower().replace(' ', '_')
+
+
+def version_tag(vocabulary):
+    """Tag covering the word list, inflections and tokenizer, so stale entries are ignored."""
+    try:
+        tokenizer = metadata.version('nltk')
+    except metadata.PackageNotFoundError:
+        tokenizer = 'unknown'
+
+    digest = hashlib.sha1()
+    digest.update(','.join(vocabulary.words).encode())
+    digest.update(','.join(sorted('{}>{}'.format(form, word)
+                                  for form, word in vocabulary.inflections.items())).encode())
+    digest.update('nltk-{} format-{}'.format(tokenizer, STORE_FORMAT).encode())
+    return digest.hexdigest()[:16]
+
+
+class ArticleStore(object):
+    """Compressed per-article word counts on disk, evicting the least recently used."""
+
+    def __init__(self, path, vocabulary, max_entries=20000):
+        """Initialise the parameters"""
+        self.path = path
+        self.vocabulary = vocabulary
+        self.max_entries = max_entries
+        self.version = version_tag(vocabulary)
+        os.makedirs(path, exist_ok=True)
+
+        self.entries = sum(1 for name in os.listdir(path) if name.endswith('.npz'))
+        self.hits = 0
+        self.misses = 0
+
+    def file_name(self, title, mode_choice=0):
+        """Get the file an article is stored in."""
+        key = '{} {} {}'.format(self.version, mode_choice, normalise_title(title))
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest() + '.npz')
+
+    def get(self, title, mode_choice=0):
+        """Get the stored counts for an article, or None if it isn't stored."""
+        file_name = self.file_name(title, mode_choice)
+        try:
+            with np.load(file_name) as data:
+                if str(data['version']) != self.version:
+                    raise KeyError(file_name)
+                article = ArticleCounts(data['ids'], data['counts'],
+                                        [str(link) for link in data['links']])
+            # Mark as recently used
+            os.utime(file_name)
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return article
+
+    def age(self, title, mode_choice=0):
+        """Get the seconds since an article was fetched, or None if it isn't stored."""
+        try:
+            with np.load(self.file_name(title, mode_choice)) as data:
+                return time.time() - float(data['fetched'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def put(self, title, article, mode_choice=0):
+        """Store the counts for an article."""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, version=self.version, ids=article.ids, counts=article.counts,
+                            links=np.array(article.links, dtype=str), fetched=time.time())
+
+        # Write to a temporary file first so readers never see half an entry
+        file_name = self.file_name(title, mode_choice)
+        is_new = not os.path.exists(file_name)
+        fd, temp_name = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(buffer.getvalue())
+            os.replace(temp_name, file_name)
+        except BaseException:
+            # Don't leave half an entry behind (e.g. when the disk is full)
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+            raise
+
+        if is_new:
+            self.entries += 1
+            if self.entries > self.max_entries:
+                self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries, down to 90% of the maximum."""
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith('.npz'):
+                entries.append((entry.stat().st_mtime, entry.path))
+        entries.sort()
+
+        remove = len(entries) - int(self.max_entries * 0.9)
+        for _, file_name in entries[:max(remove, 0)]:
+            try:
+                os.remove(file_name)
+            except OSError:
+                pass
+        self.entries = len(entries) - max(remove, 0)
+
+    def stats(self):
+        """Get the store hit/miss stats."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'entries': self.entries,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                }
+
+
+def init_worker(store_path, match_inflections, rate):
+    """Set up a worker process with its share of the request rate, the vocabulary and the store."""
+    request_scheduler.SCHEDULER = request_scheduler.RequestScheduler(rate=rate,
+                                                                     burst=max(int(rate), 1))
+    vocabulary = load_vocabulary(match_inflections)
+    WORKER.clear()
+    WORKER['vocabulary'] = vocabulary
+    WORKER['store'] = ArticleStore(store_path, vocabulary)
+
+
+def fetch_article(title, vocabulary, store=None, mode_choice=0, refresh=False, deadline=None):
+    """Get the word counts for an article, only fetching and parsing it if not stored.
+
+    A deadline (a time.monotonic() time) limits the time spent waiting on
+    Wikipedia, raising TransientFetchError if it would be missed.
+    """
+    if store is not None and not refresh:
+        article = store.get(title, mode_choice)
+        if article is not None:
+            return article
+
+    validation = Validation(title)
+    validation.scrape_wiki(mode_choice, deadline)
+    validation.process_wiki()
+    article = validation.count_words(vocabulary)
+
+    if store is not None:
+        try:
+            store.put(title, article, mode_choice)
+        except OSError as error:
+            # The article is still fine, it just has to be fetched again next time
+            print('Could not store {!r}: {}'.format(title, error), file=sys.stderr)
+    return article
@@ -0,0 +1,177 @@
+"""Score tournament submissions without the game window.
+
+    python batch_score.py submissions.jsonl [--output tournament.csv] [--workers 4]
+
+Each line of the submissions file is a JSON object like
+
+    {"name": "abc", "seed": 1234, "board_size": 5, "limit": 5,
+     "titles": ["Germany", "Music", ...]}
+
+(board_size and limit default to 5, as in the game). The board is
+regenerated from the seed and the titles are played in order, exactly as
+if they were typed into the game, in parallel worker processes sharing the
+article store. The winners are written to a leaderboard file in the same
+format as leaderboard.csv.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from article_store import STORE_PATH, WORKER, fetch_article, init_worker, normalise_title
+from board import Board, score_game
+from request_scheduler import TransientFetchError
+
+DEFAULT_BOARD_SIZE = 5
+DEFAULT_LIMIT = 5
+
+# Articles each worker keeps in memory (the rest are read back from the store)
+MAX_ARTICLES = 1000
+
+
+def read_submissions(file_name):
+    """Read the submissions, one JSON object per line."""
+    submissions = []
+    with open(file_name) as f:
+        for line in f:
+            if line.strip():
+                submissions.append(json.loads(line))
+    return submissions
+
+
+def get_article(title):
+    """Get an article (or the error fetching it), remembering recent ones for this worker."""
+    articles = WORKER.setdefault('articles', OrderedDict())
+    key = normalise_title(title)
+    if key in articles:
+        articles.move_to_end(key)
+        return articles[key]
+
+    try:
+        article = fetch_article(title, WORKER['vocabulary'], WORKER['store'])
+    except TransientFetchError:
+        # Might work next time, so don't remember it
+        raise
+    except Exception as error:
+        article = error
+    articles[key] = article
+    if len(articles) > MAX_ARTICLES:
+        articles.popitem(last=False)
+    return article
+
+
+def score_submission(submission):
+    """Play a submission through, returning (name, final score or None, turns, error).
+
+    Follows Game.main_screen: every title that was fetched, or that has no
+    article, costs a turn, and titles after the game is won are ignored.
+    """
+    name = submission.get('name')
+    try:
+        board_size = int(submission.get('board_size', DEFAULT_BOARD_SIZE))
+        limit = int(submission.get('limit', DEFAULT_LIMIT))
+        board = Board(board_size, limit, WORKER['vocabulary'], int(submission['seed']))
+        titles = submission['titles']
+    except (KeyError, TypeError, ValueError) as error:
+        return name, None, 0, 'Bad submission: {}: {}'.format(type(error).__name__, error)
+
+    turns = 0
+    for title in titles:
+        if board.game_won():
+            break
+
+        try:
+            article = get_article(title.lower())
+        except TransientFetchError as error:
+            # Not the player's fault, but the game can't be scored without it
+            return name, None, turns, 'Could not fetch {!r}: {}'.format(title, error)
+        turns += 1
+
+        if not isinstance(article, Exception):
+            board.apply_article(article)
+
+    if not board.game_won():
+        return name, None, turns, None
+    return name, score_game(board_size, limit, turns), turns, None
+
+
+def score_all(submissions, store_path=STORE_PATH, workers=None, rate=10.0,
+              match_inflections=True, report_every=100, out=sys.stdout):
+    """Score a list of submissions, returning the results in the same order.
+
+    With workers=0 everything runs in this process (the default is one
+    worker per CPU).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    start = time.monotonic()
+
+    if workers:
+        executor = ProcessPoolExecutor(workers, initializer=init_worker,
+                                       initargs=(store_path, match_inflections, rate / workers))
+        results = executor.map(score_submission, submissions, chunksize=8)
+    else:
+        executor = None
+        init_worker(store_path, match_inflections, rate)
+        results = (score_submission(submission) for submission in submissions)
+
+    scored = []
+    try:
+        for done, result in enumerate(results, 1):
+            scored.append(result)
+            if done % report_every == 0:
+                elapsed = time.monotonic() - start
+                print('{}/{} submissions in {:.0f}s ({:.1f}/s)'.format(
+                    done, len(submissions), elapsed, done / elapsed if elapsed else 0.0),
+                    file=out, flush=True)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return scored
+
+
+def write_leaderboard(results, file_name):
+    """Write the winners' (score, name) rows, best first, like leaderboard.csv."""
+    rows = sorted(((score, name) for name, score, _, error in results
+                   if score is not None and error is None),
+                  key=lambda row: row[0], reverse=True)
+    with open(file_name, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['score', 'name'])
+        writer.writerows(rows)
+    return rows
+
+
+def main():
+    """Run the main process."""
+    parser = argparse.ArgumentParser(description='Score tournament submissions')
+    parser.add_argument('submissions', help='JSON lines file of submissions')
+    parser.add_argument('--output', default='tournament.csv', help='leaderboard file to write')
+    parser.add_argument('--store', default=STORE_PATH, help='article store directory')
+    parser.add_argument('--workers', type=int,
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='total requests per second to Wikipedia (for uncached titles)')
+    parser.add_argument('--exact', action='store_true',
+                        help='for games played without inflection matching')
+    args = parser.parse_args()
+
+    submissions = read_submissions(args.submissions)
+    results = score_all(submissions, args.store, args.workers, args.rate, not args.exact)
+    rows = write_leaderboard(results, args.output)
+    print('{} of {} submissions won, written to {}'.format(len(rows), len(results), args.output))
+
+    for name, score, turns, error in results:
+        if error:
+            print('  {}: {}'.format(name, error))
+        elif score is None:
+            print('  {}: did not win in {} turns'.format(name, turns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Measure the main screen frame time for different board sizes.
+
+Run from the repository root:
+
+    python benchmarks/bench_board.py
+
+Only the tiles in the viewport are drawn, so the frame time should depend
+on what is visible rather than on the number of tiles. Also checks the
+tile atlas stays within its memory limit while scrolling a zoomed-in board.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pygame  # noqa: E402
+
+import game  # noqa: E402
+from board import Board  # noqa: E402
+from pygame_textinput import TextInput  # noqa: E402
+import viewport  # noqa: E402
+from viewport import Viewport  # noqa: E402
+
+
+def frame_time(size, zoom=None, frames=100):
+    """Draw the main screen for a board, returning the mean ms per frame."""
+    g = game.Game()
+    g.board_size = size
+    g.board = Board(size, 5, game.get_vocabulary())
+    g.board.counts[:] = 2
+    g.viewport = Viewport(size, game.BOARD_AREA, (game.WINDOWWIDTH, game.WINDOWHEIGHT),
+                          (game.TILE_WIDTH, game.TILE_HEIGHT))
+    if zoom == 'fit':
+        g.viewport.zoom_at(g.viewport.min_zoom, (0, 0))
+    elif zoom == 'max':
+        g.viewport.zoom_at(viewport.MAX_ZOOM, (0, 0))
+    g.textinput = TextInput()
+    g.buttons = {}
+    g.message_array = None
+    g.score = 0
+
+    # Warm up the caches
+    g.draw_main_screen()
+    start = time.perf_counter()
+    for _ in range(frames):
+        g.draw_main_screen()
+    return 1000 * (time.perf_counter() - start) / frames, g
+
+
+def scroll_memory(size=50):
+    """Scroll over a whole board at the maximum zoom, returning the atlas MB."""
+    _, g = frame_time(size, 'max', frames=1)
+    step = g.viewport.area.width // 2
+    for y in range(0, g.viewport.board_pixels()[1], g.viewport.area.height // 2):
+        for x in range(0, g.viewport.board_pixels()[0], step):
+            g.viewport.offset = [x, y]
+            g.viewport.clamp()
+            g.draw_main_screen()
+    return g.viewport.atlas.bytes / 2 ** 20
+
+
+def main():
+    """Run the main process."""
+    pygame.init()
+    print('{:>6} {:>6} {:>10}'.format('board', 'zoom', 'ms/frame'))
+    for size, zoom in [(5, None), (7, None), (20, None), (50, None), (90, None),
+                       (20, 'fit'), (50, 'fit'), (90, 'fit'), (50, 'max')]:
+        ms, _ = frame_time(size, zoom, frames=20 if zoom == 'fit' else 100)
+        print('{:>6} {:>6} {:>10.2f}'.format('{0}x{0}'.format(size), zoom or '1', ms))
+    print('Atlas after scrolling 50x50 at max zoom: {:.0f} MB'.format(scroll_memory()))
+
+
+if __name__ == '__main__':
+    main()
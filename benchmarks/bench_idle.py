@@ -0,0 +1,73 @@
+"""Measure the CPU used by the game loops when idle and during input.
+
+Run from the repository root:
+
+    python benchmarks/bench_idle.py [seconds]
+
+The 'fixed' rows force the old behaviour (redraw at the full FPS all the time)
+for comparison. Note that SDL's dummy video driver polls inside
+pygame.event.wait, so idle numbers are lower still with a real display.
+"""
+
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pygame  # noqa: E402
+
+import game  # noqa: E402
+
+
+def run(screen, seconds, fixed, active):
+    """Run one of the game loops for some seconds and return the CPU time used."""
+    game.ACTIVE_TIME = float('inf') if fixed else 1000
+    g = game.Game()
+    stop = time.monotonic() + seconds
+
+    def poke():
+        while time.monotonic() < stop:
+            if active:
+                pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1),
+                                                     rel=(1, 1), buttons=(0, 0, 0)))
+            time.sleep(0.05)
+        g.loop_stage = False
+        # Wake the loop so it sees loop_stage
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+
+    if fixed:
+        # Redraw every frame, as the loops used to
+        get_events = g.get_events
+        g.get_events = lambda *args: get_events(*args) or [pygame.event.Event(pygame.NOEVENT)]
+
+    thread = threading.Thread(target=poke)
+    start = time.process_time()
+    thread.start()
+    if screen == 'start':
+        g.start_screen()
+    else:
+        g.main_screen()
+    thread.join()
+    return time.process_time() - start
+
+
+def main():
+    """Run the main process."""
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pygame.init()
+    print('{:<8} {:<8} {:<8} {:>10}'.format('screen', 'input', 'mode', 'CPU %'))
+    for screen in ['start', 'main']:
+        for active in [False, True]:
+            for fixed in [True, False]:
+                cpu = run(screen, seconds, fixed, active)
+                print('{:<8} {:<8} {:<8} {:>10.1f}'.format(screen,
+                                                          'active' if active else 'idle',
+                                                          'fixed' if fixed else 'adaptive',
+                                                          100 * cpu / seconds))
+
+
+if __name__ == '__main__':
+    main()
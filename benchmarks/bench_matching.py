@@ -0,0 +1,51 @@
+"""Measure the cost of matching an article's tokens to the vocabulary.
+
+Run from the repository root:
+
+    python benchmarks/bench_matching.py
+
+Compares exact matching with inflection matching for articles of different
+lengths. The per-token cost should stay flat as articles grow.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np  # noqa: E402
+
+from inflections import load_index  # noqa: E402
+from vocabulary import Vocabulary  # noqa: E402
+from word_generation import get_word_list  # noqa: E402
+
+
+def make_article(words, forms, length, rng):
+    """Make a fake article: a mix of vocabulary words, inflected forms and other words."""
+    pool = list(words) + list(forms) + ['the', 'of', 'and', 'Zyxwv', '1999', ','] * 2000
+    return [str(token) for token in rng.choice(pool, length)]
+
+
+def main():
+    """Run the main process."""
+    words = get_word_list('no_stop_g2.txt')
+    index = load_index()
+    exact = Vocabulary(words)
+    inflected = Vocabulary(words, index)
+    rng = np.random.RandomState(0)
+
+    print('{:>8} {:>14} {:>14}'.format('tokens', 'exact ns/tok', 'inflect ns/tok'))
+    for length in [1000, 10000, 100000]:
+        tokens = make_article(words, index, length, rng)
+        row = []
+        for vocabulary in [exact, inflected]:
+            timer = timeit.Timer(lambda: vocabulary.count(tokens))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(3, number)) / number
+            row.append(1e9 * best / length)
+        print('{:>8} {:>14.0f} {:>14.0f}'.format(length, *row))
+
+
+if __name__ == '__main__':
+    main()
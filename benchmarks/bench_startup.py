@@ -0,0 +1,68 @@
+"""Measure how long the game takes to import and to show its first frame.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [repeats]
+
+Each measurement is a fresh interpreter, so nothing is already imported.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+IMPORT_ONLY = '''
+import time
+start = time.perf_counter()
+import game
+print(time.perf_counter() - start)
+'''
+
+FIRST_FRAME = '''
+import os, time
+start = time.perf_counter()
+import pygame
+import game
+pygame.init()
+g = game.Game()
+draw = g.draw_start_screen
+def first_frame():
+    draw()
+    print(time.perf_counter() - start, flush=True)
+    os._exit(0)
+g.draw_start_screen = first_frame
+g.start_screen()
+'''
+
+
+def measure(code, repeats):
+    """Run some code in fresh interpreters, returning the in-process and total times."""
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy',
+               PYGAME_HIDE_SUPPORT_PROMPT='1')
+    inner = []
+    outer = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                check=True).stdout
+        outer.append(time.perf_counter() - start)
+        inner.append(float(output.split()[-1]))
+    return statistics.median(inner), statistics.median(outer)
+
+
+def main():
+    """Run the main process."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print('{:<14} {:>12} {:>14}'.format('stage', 'in-process', 'incl. python'))
+    for name, code in [('import only', IMPORT_ONLY), ('first frame', FIRST_FRAME)]:
+        inner, outer = measure(code, repeats)
+        print('{:<14} {:>10.0f}ms {:>12.0f}ms'.format(name, 1000 * inner, 1000 * outer))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""The Bingo board state."""
+
+from collections import namedtuple
+
+from lazy_import import LazyModule
+
+from vocabulary import ID_DTYPE
+from word_generation import TargetWord
+
+np = LazyModule('numpy')
+
+
+# One entry for each tile an article added to.
+TileUpdate = namedtuple('TileUpdate', ['x', 'y', 'word', 'count', 'added', 'total',
+                                       'limit', 'new_word'])
+
+
+# Boards are generated from seeds in this range
+MAX_SEED = 2 ** 31
+
+
+def score_game(board_size, limit, turns):
+    """
+    Scores a player's performance
+
+    Parameters
+    ---------
+    board_size : int
+        Size of the grid, e.g. 3, 5 or 7 for 3by3, 5by5 and 7by7
+    limit : int
+        Either 3, 5 or 7 for Easy, Medium and Hard
+    turns : int
+        number of wiki articles used to win
+    """
+
+    # 2000, 4000 and 6000 for 3by3, 5by5 and 7by7, and so on for bigger boards
+    final_score = 1000 * (board_size - 1)
+
+    if limit == 3:
+        final_score += 4000
+    elif limit == 5:
+        final_score += 6000
+    elif limit == 7:
+        final_score += 8000
+
+    return int(final_score / (turns + 1))
+
+
+class Board(object):
+    """A grid of word IDs with their counts and limits.
+
+    The words (including the ones that replace overflowed tiles) are drawn
+    from a RandomState seeded with seed, so the same seed and articles
+    always give the same game.
+    """
+
+    def __init__(self, size, limit, vocabulary, seed=None):
+        """Initialise the parameters"""
+        self.size = size
+        self.limit = limit
+        self.vocabulary = vocabulary
+        if seed is None:
+            seed = int(np.random.randint(MAX_SEED))
+        self.seed = seed
+        self.rng = np.random.RandomState(seed)
+        if size * size >= len(vocabulary):
+            raise ValueError('A {0}x{0} board needs more than {1} words'.format(size, len(vocabulary)))
+
+        # IDs of the words currently on the board, to avoid repeats
+        self.on_board = set()
+
+        ids = []
+        limits = []
+        for _ in range(size * size):
+            word_id, word_limit = self.get_new_word()
+            self.on_board.add(word_id)
+            ids.append(word_id)
+            limits.append(word_limit)
+        self.ids = np.array(ids, dtype=ID_DTYPE).reshape((size, size))
+        self.limits = np.array(limits).reshape((size, size))
+
+        self.counts = np.zeros((size, size), dtype=int)
+        self.new = np.zeros((size, size), dtype=bool)
+
+    @property
+    def words(self):
+        """The grid of words on the board."""
+        return self.vocabulary.word_array[self.ids]
+
+    def get_new_word(self):
+        """Get an unused word ID from the vocabulary."""
+        while True:
+            target = TargetWord(self.vocabulary.words, self.rng)
+            target.word_gen()
+            word_id = self.vocabulary.word_id(target.word)
+            target.range_gen()
+
+            if word_id not in self.on_board:
+                break
+
+        return word_id, self.limit
+
+    def apply_article(self, article):
+        """Add the counts from an article to the board, replacing overflowed words.
+
+        Returns a list of TileUpdates, the largest additions first.
+        """
+        # Reset the new word markers
+        self.new[:] = False
+
+        added = article.lookup(self.ids)
+        hit = added > 0
+        totals = self.counts + added
+        overflow = hit & (totals >= self.limits)
+
+        updates = []
+        xs, ys = np.nonzero(hit)
+        order = np.argsort(-added[xs, ys], kind='stable')
+        for x, y in zip(xs[order], ys[order]):
+            new_word = None
+            if overflow[x, y]:
+                old_id = self.ids[x, y]
+                new_id, new_limit = self.get_new_word()
+                self.on_board.discard(old_id)
+                self.on_board.add(new_id)
+                new_word = self.vocabulary.words[new_id]
+
+            updates.append(TileUpdate(x, y,
+                                      self.vocabulary.words[self.ids[x, y]],
+                                      self.counts[x, y], added[x, y], totals[x, y],
+                                      self.limits[x, y], new_word))
+
+            if new_word:
+                self.ids[x, y] = new_id
+                self.limits[x, y] = new_limit
+                self.new[x, y] = True
+
+        self.counts = np.where(overflow, 0, totals)
+        return updates
+
+    def game_won(self):
+        """Determine if any row or column is complete."""
+        filled = self.counts > 0
+        return bool(filled.all(axis=1).any() or filled.all(axis=0).any())
@@ -1,29 +1,52 @@
 """Wikipedia Bingo code."""
 
+import argparse
+import csv
+import functools
 import sys
-from collections import Counter
-
-import numpy as np
-import pandas as pd
 
 import pygame
 import pygame.locals as loc
 
 from pygame_textinput import TextInput
 
-from validate_numbers import Validation
+from text_cache import TEXT_CACHE, render_text
+
+from lazy_import import LazyModule, preload
+
+from board import Board, score_game
+
+from article_store import STORE_PATH, ArticleStore
+
+from prefetch import Prefetcher
+
+from request_scheduler import TransientFetchError
+
+from spectator import SpectatorServer
+
+from viewport import Viewport
+
+from vocabulary import load_vocabulary
 
-from word_generation import TargetWord, get_word_list
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
 
 
 # Create the constants (go ahead and experiment with different values)
 BOARDSIZE = 5
+# Largest board the word list can fill (with spare words for overflows)
+MAX_BOARD_SIZE = 90
 TILESIZE = 80
 TILE_WIDTH = 200
 TILE_HEIGHT = 80
 WINDOWWIDTH = 1920
 WINDOWHEIGHT = 800
+# Where the board can go without covering the messages, buttons and text box
+BOARD_AREA = (250, 60, WINDOWWIDTH - 420, WINDOWHEIGHT - 140)
 FPS = 30
+ACTIVE_TIME = 1000  # ms at the full FPS after any input
+IDLE_TIMEOUT = 1000  # longest ms to block for when idle
+FETCH_TIMEOUT = 3  # longest seconds the window waits for an article
 BLANK = None
 
 # Colours (R, G, B)
@@ -41,14 +64,47 @@ BUTTONTEXTCOLOR = BLACK
 MESSAGECOLOR = BLACK
 
 BASICFONTSIZE = 20
-BASICFONT = pygame.font.Font('freesansbold.ttf', BASICFONTSIZE)
 
-ALL_WORDS = get_word_list('no_stop_g2.txt')
+# Count inflected forms towards the board words ("wars" towards "war")
+MATCH_INFLECTIONS = True
+
+# Slow modules to import in the background once the start screen is up
+PRELOAD_MODULES = ['numpy', 'pandas', 'bs4', 'nltk']
+
+
+@functools.lru_cache()
+def get_basic_font():
+    """Load the font the first time it is needed."""
+    return pygame.font.Font('freesansbold.ttf', BASICFONTSIZE)
+
+
+@functools.lru_cache()
+def get_vocabulary():
+    """Load the word list the first time it is needed."""
+    return load_vocabulary(MATCH_INFLECTIONS)
+
+
+@functools.lru_cache()
+def get_article_store():
+    """Open the article store the first time it is needed."""
+    return ArticleStore(STORE_PATH, get_vocabulary())
+
+
+@functools.lru_cache()
+def get_prefetcher():
+    """Start the background prefetcher the first time it is needed."""
+    return Prefetcher(get_vocabulary(), get_article_store())
+
+
+def load_leaderboard(file_name='leaderboard.csv'):
+    """Read the (name, score) rows from the leaderboard, without needing pandas."""
+    with open(file_name) as f:
+        return [(row['name'], float(row['score'])) for row in csv.DictReader(f)]
 
 
 def make_text(text, color, bgcolor, top, left):
     """Create the Surface and Rect objects for some text."""
-    surface = BASICFONT.render(text, True, color, bgcolor)
+    surface = render_text(get_basic_font(), text, True, color, bgcolor)
     rect = surface.get_rect()
     rect.topleft = (top, left)
     return (surface, rect)
@@ -67,6 +123,7 @@ class Game(object):
     def __init__(self):
         # Create the clock
         self.clock = pygame.time.Clock()
+        self.last_input = 0
 
         # Create the game window
         self.window = pygame.display.set_mode((WINDOWWIDTH, WINDOWHEIGHT))
@@ -75,6 +132,11 @@ class Game(object):
         # Default game options (changed on start screen)
         self.limit = 5
         self.board_size = 5
+        # Board seed (None for a random board each game)
+        self.seed = None
+
+        # Live feed for spectators (started with --spectator-port)
+        self.spectators = None
 
     def run(self):
         """Run the game until it quits."""
@@ -164,9 +226,39 @@ class Game(object):
                                          WINDOWWIDTH / 2 + 100, 600)
         self.buttons['7x7_sel'].action = self.set_board_size_to_7x7
 
+        self.buttons['20x20'] = Button('20x20',
+                                       TEXTCOLOR, TILECOLOR,
+                                       WINDOWWIDTH / 2 + 250, 600)
+        self.buttons['20x20'].action = self.set_board_size_to_20x20
+        self.buttons['20x20_sel'] = Button('20x20',
+                                           TEXTCOLOR, WHITE,
+                                           WINDOWWIDTH / 2 + 250, 600)
+        self.buttons['20x20_sel'].action = self.set_board_size_to_20x20
+
+        self.buttons['50x50'] = Button('50x50',
+                                       TEXTCOLOR, TILECOLOR,
+                                       WINDOWWIDTH / 2 + 400, 600)
+        self.buttons['50x50'].action = self.set_board_size_to_50x50
+        self.buttons['50x50_sel'] = Button('50x50',
+                                           TEXTCOLOR, WHITE,
+                                           WINDOWWIDTH / 2 + 400, 600)
+        self.buttons['50x50_sel'].action = self.set_board_size_to_50x50
+
+        # Load the images and text
+        self.logo = pygame.image.load('WIKIPEDIA_BINGO_small.png')
+        with open('instructions.txt') as f:
+            self.instructions = f.read().split('\n')
+        self.high_scores = load_leaderboard()
+
+        # Draw the initial screen
+        self.draw_start_screen()
+
+        # Load everything the main screen needs while the player chooses
+        preload(PRELOAD_MODULES, get_vocabulary)
+
         while self.loop_stage:
-            # Get events
-            events = pygame.event.get()
+            # Get events (waits while idle)
+            events = self.get_events()
 
             # Check clicks
             for event in events:
@@ -180,11 +272,9 @@ class Game(object):
             # Check for exit
             self.check_for_quit(events)
 
-            # Draw the board
-            self.draw_start_screen()
-
-            # Tick the FPS clock
-            self.clock.tick(FPS)
+            # Only redraw if something happened
+            if events:
+                self.draw_start_screen()
 
     def draw_start_screen(self):
         """Draw the start screen."""
@@ -195,18 +285,15 @@ class Game(object):
         # self.window.blit(surf, rect)
 
         # Draw the logo
-        img = pygame.image.load('WIKIPEDIA_BINGO_small.png')
-        rect = img.get_rect()
+        rect = self.logo.get_rect()
         rect.center = (WINDOWWIDTH / 2, 200)
-        self.window.blit(img, rect)
+        self.window.blit(self.logo, rect)
 
         # Draw the instructions
         txt = 'INSTRUCTIONS'
         surf, rect = make_text(txt, MESSAGECOLOR, BGCOLOR, 100, 200)
         self.window.blit(surf, rect)
-        with open('instructions.txt') as f:
-            text = f.read().split('\n')
-        for i, line in enumerate(text):
+        for i, line in enumerate(self.instructions):
             textSurf, textRect = make_text(line, MESSAGECOLOR, BGCOLOR, 100, 230 + 20 * i)
             self.window.blit(textSurf, textRect)
 
@@ -221,34 +308,22 @@ class Game(object):
         txt = 'Chose board size:'
         surf, rect = make_text(txt, MESSAGECOLOR, BGCOLOR, 850, 550)
         self.window.blit(surf, rect)
+        chosen = ['{0}x{0}'.format(self.board_size), 'limit{}'.format(self.limit)]
         for button_name in self.buttons:
             button = self.buttons[button_name]
-            # Size pressed
-            if self.board_size == 3 and button_name in ['3x3', '5x5_sel', '7x7_sel']:
-                continue
-            elif self.board_size == 5 and button_name in ['3x3_sel', '5x5', '7x7_sel']:
-                continue
-            elif self.board_size == 7 and button_name in ['3x3_sel', '5x5_sel', '7x7']:
-                continue
-            # Limit button pressed
-            elif self.limit == 3 and button_name in ['limit3', 'limit5_sel', 'limit7_sel']:
-                continue
-            elif self.limit == 5 and button_name in ['limit3_sel', 'limit5', 'limit7_sel']:
-                continue
-            elif self.limit == 7 and button_name in ['limit3_sel', 'limit5_sel', 'limit7']:
-                continue
-            else:
-                self.window.blit(button.surface, button.rect)
+            # Option buttons have a normal and a selected ("_sel") version
+            option = button_name.replace('_sel', '')
+            if 'x' in option or option.startswith('limit'):
+                if (option in chosen) != button_name.endswith('_sel'):
+                    continue
+            self.window.blit(button.surface, button.rect)
 
         # Draw the leaderboard
         txt = 'HIGH SCORES'
         surf, rect = make_text(txt, MESSAGECOLOR, BGCOLOR, 1500, 200)
         self.window.blit(surf, rect)
 
-        scoreboard = pd.read_csv('leaderboard.csv')
-        strings = scoreboard['name'].values
-        scores = scoreboard['score'].values
-        for i, (name, score) in enumerate(zip(strings[:25], scores[:25])):
+        for i, (name, score) in enumerate(self.high_scores[:25]):
             msg = '{: >5.0f}'.format(score)
             textSurf, textRect = make_text(msg, MESSAGECOLOR, BGCOLOR, 1500, 250 + 20 * i)
             self.window.blit(textSurf, textRect)
@@ -267,11 +342,14 @@ class Game(object):
         self.name = None
 
         # Generate a new puzzle
-        self.get_starting_board()
+        self.board = Board(self.board_size, self.limit, get_vocabulary(), self.seed)
 
-        # Create list of red tiles
-        self.board_counts = np.zeros((self.board_size, self.board_size))
-        self.board_new = np.zeros((self.board_size, self.board_size))
+        # Only the part of the board in the viewport gets drawn
+        self.viewport = Viewport(self.board_size, BOARD_AREA,
+                                 (WINDOWWIDTH, WINDOWHEIGHT), (TILE_WIDTH, TILE_HEIGHT))
+
+        # Start fetching articles named after the board words
+        get_prefetcher().update(self.board.words.flatten())
 
         # Quit button
         self.buttons = {}
@@ -289,12 +367,15 @@ class Game(object):
         # Initial score.
         self.score = 0
 
+        if self.spectators is not None:
+            self.spectators.publish_board(self.board, self.score)
+
         # Draw the initial board
         self.draw_main_screen()
 
         while self.loop_stage:
-            # Get events
-            events = pygame.event.get()
+            # Get events (waits while idle, but wakes for the cursor to blink)
+            events = self.get_events(self.textinput)
 
             # Check clicks
             for event in events:
@@ -305,6 +386,9 @@ class Game(object):
                         if button.rect.collidepoint(event.pos):
                             button.action()
 
+                # Scroll and zoom big boards
+                self.viewport.handle_event(event)
+
             # Send events to the text reader
             if self.textinput.update(events):
                 # Pressed enter
@@ -317,10 +401,12 @@ class Game(object):
                     if command in ['q', 'quit']:
                         self.terminate()
                     if command == 'add':
-                        self.board_counts += 1
+                        self.board.counts += 1
+                        if self.spectators is not None:
+                            self.spectators.publish_board(self.board, self.score)
                 else:
                     # DEBUG
-                    print(self.board_words)
+                    print(self.board.words)
 
                     # Get the article title
                     title = user_input.lower()
@@ -329,64 +415,54 @@ class Game(object):
                     self.message_array = [title + ':']
 
                     if not self.game_won():
-                        # Reset the new word counter
-                        self.board_new = np.zeros((self.board_size, self.board_size))
+                        # Reset the new word markers
+                        self.board.new[:] = False
 
-                        # Get the wikipedia article
-                        validation = Validation(title)
+                        # Get the wikipedia article (or the stored counts)
                         try:
-                            validation.scrape_wiki()
-                            validation.process_wiki()
-                            words = validation.token
+                            article = get_prefetcher().get(title, FETCH_TIMEOUT)
                             self.score += 1
                             print(self.score)
+                        except TransientFetchError:
+                            # Not the player's fault, so it doesn't cost a turn
+                            self.message_array.append('Wikipedia is busy, try again')
+                            article = None
                         except Exception:
                             self.message_array.append('Article not found')
-                            words = []
+                            article = None
                             self.score += 1
                             print(self.score)
 
-                        # Remove any words not on the board
-                        words = [word.lower()
-                                 for word in words
-                                 if word.lower() in self.board_words.flatten()]
-
-                        # Count the frequencies
-                        counter = Counter(words)
+                        # Add the counts of any words on the board
+                        updates = self.board.apply_article(article) if article else []
 
                         # Create the message for the top left
-                        if len(words) == 0:
+                        if len(updates) == 0:
                             self.message_array.append('No valid words')
 
-                        for word in sorted(counter, key=lambda x: counter[x], reverse=True):
-                            x, y = tuple(np.argwhere(self.board_words == word.lower())[0])
-                            current_count = self.board_counts[x][y]
-                            limit = self.board_limits[x][y]
-                            new_count = current_count + counter[word]
-
-                            # Create the message array for the left hand courner
-                            message = '{} ({:.0f})+{:.0f} = {:.0f}/{:.0f}'.format(word,
-                                                                                  current_count,
-                                                                                  counter[word],
-                                                                                  new_count,
-                                                                                  limit)
+                        for update in updates:
+                            message = '{} ({:.0f})+{:.0f} = {:.0f}/{:.0f}'.format(update.word,
+                                                                                  update.count,
+                                                                                  update.added,
+                                                                                  update.total,
+                                                                                  update.limit)
                             self.message_array.append(message)
 
                             # Check if the counter has overflowed
-                            new_word = None
-                            new_range = None
-                            if new_count >= limit:
-                                new_count = 0
-                                new_word, new_range = self.get_new_word()
-                                self.message_array.append('  OVERFLOW > {}'.format(new_word))
-
-                            # Save the new count, new word (if needed) and message
-                            self.board_counts[x][y] = new_count
-                            if new_word:
-                                print(new_word)
-                                self.board_words[x][y] = new_word
-                                self.board_limits[x][y] = new_range
-                                self.board_new[x][y] = 1
+                            if update.new_word:
+                                print(update.new_word)
+                                self.message_array.append('  OVERFLOW > {}'.format(update.new_word))
+
+                        # Send the changes to any spectators
+                        if self.spectators is not None:
+                            self.spectators.publish_turn(updates, self.score)
+                            if self.game_won():
+                                self.scoring_algorithm()
+                                self.spectators.publish_win(self.final_score)
+
+                        # Prefetch for the new board and the links from this article
+                        links = article.links if article is not None else ()
+                        get_prefetcher().update(self.board.words.flatten(), links)
                     else:
                         # You win!
                         self.scoring_algorithm()
@@ -411,46 +487,59 @@ class Game(object):
             # Draw the board
             self.draw_main_screen()
 
-            # Tick the FPS clock
-            self.clock.tick(FPS)
-
     def draw_main_screen(self):
         """Draw the main screen."""
         self.window.fill(BGCOLOR)
         # Draw the board
-        for tilex in range(len(self.board_words)):
-            for tiley in range(len(self.board_words[0])):
-                word = self.board_words[tilex][tiley]
+        words = self.board.vocabulary.words
+        ids = self.board.ids
+        tilexs, tileys = self.viewport.visible_tiles()
+        self.window.set_clip(BOARD_AREA)
+        if not self.viewport.detailed():
+            # Too small to read, so just show the colours
+            self.draw_board_overview(tilexs, tileys)
+            tilexs = tileys = []
+        for tilex in tilexs:
+            for tiley in tileys:
+                word = words[ids[tilex, tiley]]
 
                 # Change the BG colour based on the count
-                count = self.board_counts[tilex][tiley]
-                limit = self.board_limits[tilex][tiley]
+                count = self.board.counts[tilex][tiley]
+                limit = self.board.limits[tilex][tiley]
                 if 0 < count < limit:
                     bgcolour = (255, 255 - count * 255 / limit, 255 - count * 255 / limit)
                 else:
                     bgcolour = GREEN
 
                 # Change the text colour if it's new
-                new = self.board_new[tilex][tiley]
+                new = self.board.new[tilex][tiley]
                 if new:
                     bgcolour = (60, 185, 100)
 
                 # Draw the tile
                 self.draw_tile(tilex, tiley, word, count, limit, TEXTCOLOR, bgcolour)
+        self.window.set_clip(None)
 
-        left, top = self.get_tile_courner(0, 0)
-        width = self.board_size * TILE_WIDTH
-        height = self.board_size * TILE_HEIGHT
+        left, top, width, height = self.viewport.board_rect()
         pygame.draw.rect(self.window, BORDERCOLOR, (left - 5, top - 5, width + 11, height + 11), 4)
+        if not self.viewport.fits():
+            hint = 'Scroll: mouse wheel or right-drag.  Zoom: Ctrl + mouse wheel.'
+            surf, rect = make_text(hint, MESSAGECOLOR, BGCOLOR, left, top + height + 10)
+            self.window.blit(surf, rect)
 
         # Draw the count
         msg = 'COUNT: {:.0f}'.format(self.score)
         surf, rect = make_text(msg, MESSAGECOLOR, BGCOLOR, 5, 5)
         self.window.blit(surf, rect)
 
-        # Draw the message
+        # Draw the seed (to replay or submit the game)
+        msg = 'SEED: {}'.format(self.board.seed)
+        surf, rect = make_text(msg, MESSAGECOLOR, BGCOLOR, WINDOWWIDTH - 150, 100)
+        self.window.blit(surf, rect)
+
+        # Draw the message (as much as fits above the text box)
         if self.message_array:
-            for i, msg in enumerate(self.message_array):
+            for i, msg in enumerate(self.message_array[:int((WINDOWHEIGHT - 110) / 20)]):
                 textSurf, textRect = make_text(msg, MESSAGECOLOR, BGCOLOR, 5, 35 + 20 * i)
                 self.window.blit(textSurf, textRect)
 
@@ -499,6 +588,13 @@ class Game(object):
 
     def terminate(self):
         """Quit the game."""
+        print('Text cache: {}'.format(TEXT_CACHE.stats()))
+        if get_prefetcher.cache_info().currsize:
+            print('Prefetch: {}'.format(get_prefetcher().stats()))
+            get_prefetcher().shutdown()
+        if self.spectators is not None:
+            print('Spectators: {}'.format(self.spectators.stats()))
+            self.spectators.close()
         pygame.quit()
         sys.exit()
 
@@ -514,6 +610,14 @@ class Game(object):
         """Set the board size."""
         self.board_size = 7
 
+    def set_board_size_to_20x20(self):
+        """Set the board size."""
+        self.board_size = 20
+
+    def set_board_size_to_50x50(self):
+        """Set the board size."""
+        self.board_size = 50
+
     def set_limit_to_3(self):
         """Set the tile limits."""
         self.limit = 3
@@ -526,6 +630,30 @@ class Game(object):
         """Set the tile limits."""
         self.limit = 7
 
+    def get_events(self, textinput=None):
+        """Get new events, blocking while the screen is idle.
+
+        Runs at the full FPS for ACTIVE_TIME ms after any input or while a key
+        is repeating, otherwise waits for the next event or cursor blink.
+        """
+        timeout = IDLE_TIMEOUT
+        if textinput is not None:
+            timeout = min(timeout, textinput.next_update_ms())
+
+        if pygame.time.get_ticks() - self.last_input < ACTIVE_TIME or timeout == 0:
+            # Tick the FPS clock
+            self.clock.tick(FPS)
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(timeout)
+            events = [] if event.type == loc.NOEVENT else [event]
+            events += pygame.event.get()
+            self.clock.tick()
+
+        if events:
+            self.last_input = pygame.time.get_ticks()
+        return events
+
     def check_for_quit(self, events):
         """Check for quit events."""
         for event in events:
@@ -536,114 +664,108 @@ class Game(object):
                 # terminate if the KEYUP event was for the Esc key
                 self.terminate()
 
-    def get_starting_board(self):
-        """Return a board data structure with tiles in the solved state."""
-        words = []
-        ranges = []
-        for _ in range(self.board_size * self.board_size):
-            word, limit = self.get_new_word()
-            words.append(word)
-            ranges.append(limit)
-        self.board_words = np.array(words, dtype=object).reshape((self.board_size, self.board_size))
-        self.board_limits = np.array(ranges).reshape((self.board_size, self.board_size))
-
-    def get_new_word(self):
-        """Get an unused word from the list of all words."""
-        while True:
-            target = TargetWord(ALL_WORDS)
-            target.word_gen()
-            word = target.word.lower()
-            target.range_gen()
-            limit = self.limit
-
-            try:
-                if word not in self.board_words.flatten():
-                    break
-            except Exception:
-                break
-
-        return word, limit
-
     def get_tile_courner(self, tilex, tiley):
         """Get the coordinates of the top left courner of a tile."""
-        xmargin = int((WINDOWWIDTH - (TILE_WIDTH * self.board_size + (self.board_size - 1))) / 2)
-        ymargin = int((WINDOWHEIGHT - (TILE_HEIGHT * self.board_size + (self.board_size - 1))) / 2)
-        left = xmargin + (tilex * TILE_WIDTH) + (tilex - 1)
-        top = ymargin + (tiley * TILE_HEIGHT) + (tiley - 1)
-        return (left, top)
+        return self.viewport.tile_position(tilex, tiley)
 
     def draw_tile(self, tilex, tiley, word, count, limit, txtcolour=TEXTCOLOR, bgcolour=TILECOLOR):
         """Draw a tile at board coordinates tilex and tiley."""
-        left, top = self.get_tile_courner(tilex, tiley)
-        pygame.draw.rect(self.window, bgcolour, (left, top, TILE_WIDTH, TILE_HEIGHT))
-
-        surf = BASICFONT.render(str(word), True, txtcolour)
-        rect = surf.get_rect()
-        rect.center = (left + int(TILE_WIDTH / 2), top + int(TILE_HEIGHT / 2))
-        self.window.blit(surf, rect)
-
-        txt = '{:.0f}/{:.0f}'.format(count, limit)
-        # txt = '{}{}'.format('-' * int(count), '*' * int(limit - count))
-        surf = BASICFONT.render(txt, True, txtcolour)
-        rect = surf.get_rect()
-        rect.center = (left + int(TILE_WIDTH / 2) + 75, top + int(TILE_HEIGHT / 2) + 20)
-        self.window.blit(surf, rect)
+        tile_size = self.viewport.tile_size
+        key = (word, count, limit, txtcolour, bgcolour, tile_size)
+        surf = self.viewport.atlas.get(key, lambda: render_tile(word, count, limit,
+                                                                txtcolour, bgcolour, tile_size))
+        self.window.blit(surf, self.get_tile_courner(tilex, tiley))
+
+    def draw_board_overview(self, tilexs, tileys):
+        """Draw tiles as plain colours (no text) in one go, for when zoomed far out."""
+        if not tilexs or not tileys:
+            return
+        visible = (slice(tilexs.start, tilexs.stop), slice(tileys.start, tileys.stop))
+        counts = self.board.counts[visible]
+        limits = self.board.limits[visible]
+
+        # The same colours as the full size tiles
+        colours = np.empty(counts.shape + (3,), dtype=np.uint8)
+        colours[:] = GREEN
+        shade = 255 - counts * 255 / limits
+        partial = (counts > 0) & (counts < limits)
+        colours[partial, 0] = 255
+        colours[partial, 1] = colours[partial, 2] = shade[partial]
+        colours[self.board.new[visible]] = (60, 185, 100)
+
+        # One pixel per tile, blown up to the tile size (with the 1 pixel gap)
+        width, height = self.viewport.tile_size
+        columns, rows = counts.shape
+        surf = pygame.transform.scale(pygame.surfarray.make_surface(colours),
+                                      (columns * (width + 1), rows * (height + 1)))
+        for column in range(columns):
+            surf.fill(BGCOLOR, (column * (width + 1) + width, 0, 1, surf.get_height()))
+        for row in range(rows):
+            surf.fill(BGCOLOR, (0, row * (height + 1) + height, surf.get_width(), 1))
+        self.window.blit(surf, self.get_tile_courner(tilexs.start, tileys.start))
 
     def game_won(self):
         """Determine if anyone has won the game."""
-        won = False
+        return self.board.game_won()
 
-        # check for winning rows
-        for row in self.board_counts:
-            if all(row > 0):
-                won = True
+    def scoring_algorithm(self):
+        """Score the player's performance."""
+        self.final_score = score_game(self.board_size, self.limit, self.score)
 
-        # check for winning columns
-        for col in self.board_counts.T:
-            if all(col > 0):
-                won = True
 
-        return won
+def render_tile(word, count, limit, txtcolour, bgcolour, tile_size):
+    """Render a tile's background, word and count/limit label to a Surface."""
+    surf = pygame.Surface((TILE_WIDTH, TILE_HEIGHT))
+    surf.fill(bgcolour)
 
-    def scoring_algorithm(self):
-        """
-        Scores a player's performance
-
-        Parameters
-        ---------
-        N : int
-            number of wiki articles used to win
-        mode : int
-            Either 3, 5 or 7 for Easy, Medium and Hard
-        grid : int
-            Either 3, 5 or 7 for size of grid 3by3, 5by5 and 7by7
-        """
+    text = render_text(get_basic_font(), str(word), True, txtcolour)
+    rect = text.get_rect()
+    rect.center = (int(TILE_WIDTH / 2), int(TILE_HEIGHT / 2))
+    surf.blit(text, rect)
 
-        self.final_score = 0
-        if self.board_size == 3:
-            self.final_score += 2000
-        elif self.board_size == 5:
-            self.final_score += 4000
-        elif self.board_size == 7:
-            self.final_score += 6000
+    txt = '{:.0f}/{:.0f}'.format(count, limit)
+    # txt = '{}{}'.format('-' * int(count), '*' * int(limit - count))
+    text = render_text(get_basic_font(), txt, True, txtcolour)
+    rect = text.get_rect()
+    rect.center = (int(TILE_WIDTH / 2) + 75, int(TILE_HEIGHT / 2) + 20)
+    surf.blit(text, rect)
 
-        if self.limit == 3:
-            self.final_score += 4000
-        elif self.limit == 5:
-            self.final_score += 6000
-        elif self.limit == 7:
-            self.final_score += 8000
+    if tile_size != (TILE_WIDTH, TILE_HEIGHT):
+        surf = pygame.transform.smoothscale(surf, tile_size)
+    return surf
 
-        self.final_score = int(self.final_score / (self.score + 1))
+
+def board_size(value):
+    """Check a --board-size argument."""
+    size = int(value)
+    if not 1 <= size <= MAX_BOARD_SIZE:
+        raise argparse.ArgumentTypeError('board size must be from 1 to {}'.format(MAX_BOARD_SIZE))
+    return size
 
 
 def main():
     """Run the main process."""
+    parser = argparse.ArgumentParser(description='Wikipedia Bingo')
+    parser.add_argument('--board-size', type=board_size,
+                        help='use a custom board size (e.g. 30 for 30x30)')
+    parser.add_argument('--seed', type=int,
+                        help='play the board with this seed (e.g. for a tournament)')
+    parser.add_argument('--spectator-port', type=int,
+                        help='stream the game to spectators on this local port')
+    args = parser.parse_args()
+
     # Initilise PyGame
     pygame.init()
 
     # Create a game instance
     game = Game()
+    if args.board_size:
+        game.board_size = args.board_size
+    if args.seed is not None:
+        game.seed = args.seed
+    if args.spectator_port is not None:
+        game.spectators = SpectatorServer(args.spectator_port)
+        print('Spectators can connect to port {}'.format(game.spectators.port))
 
     # Run the game
     game.run()
@@ -0,0 +1,211 @@
+"""An index from inflected word forms back to the words in the word list.
+
+The index is built offline (run this file) and saved as a gzipped text file
+of "form word" lines, so the game only has to load it into a dict:
+
+    python inflections.py [corpus.txt ...]
+
+The forms are generated from the word list itself; given a corpus, only
+the forms that appear in it are kept.
+"""
+
+import gzip
+import re
+import sys
+
+from word_generation import get_word_list
+
+INDEX_FILE = 'inflections.txt.gz'
+VOWELS = 'aeiou'
+
+# Words that look inflected but aren't
+NOT_INFLECTED = {'news', 'series', 'species', 'means', 'physics', 'politics', 'economics',
+                 'mathematics', 'athletics', 'electronics', 'graphics', 'ethics', 'always',
+                 'perhaps', 'thus', 'across', 'during', 'christmas', 'texas', 'kansas',
+                 'arkansas', 'wales', 'paris', 'lens', 'gas', 'bus', 'bias', 'canvas',
+                 'does', 'goes', 'united', 'evening', 'seed', 'feed', 'string', 'wedding',
+                 'incoming', 'clothing', 'breathing'}
+
+# Words in the list that don't have regular inflections (irregular past
+# tenses, names and abbreviations), so inflecting them only makes up forms
+NOT_LEMMAS = {'came', 'went', 'made', 'took', 'gave', 'saw', 'knew', 'told', 'found', 'thought',
+              'brought', 'bought', 'caught', 'taught', 'felt', 'kept', 'left', 'meant', 'met',
+              'paid', 'said', 'sent', 'sold', 'spent', 'stood', 'understood', 'wrote', 'ran',
+              'began', 'drove', 'ate', 'fell', 'forgot', 'got', 'grew', 'held', 'led', 'lost',
+              'rose', 'sat', 'shot', 'spoke', 'struck', 'quite',
+              'ann', 'anne', 'clark', 'clarke', 'glen', 'glenn', 'julie', 'leon', 'leone', 'louis',
+              'louise', 'maine', 'marie', 'matt', 'penn', 'dell', 'deutsch', 'deutsche', 'grande',
+              'greene', 'filme', 'cal', 'cas', 'com', 'comm', 'del', 'dos', 'gras', 'bras', 'les',
+              'los', 'mas', 'mil', 'pos', 'tel', 'til', 'tri', 'wal', 'belle', 'locale', 'suite'}
+
+# Most short words in the list are abbreviations or names ("cpu", "ste",
+# "doe"), so only these get -ed and -ing forms
+SHORT_VERBS = {'act', 'add', 'age', 'aid', 'aim', 'air', 'arm', 'ask', 'ban', 'bat', 'bet', 'bid',
+               'bow', 'box', 'bug', 'buy', 'cap', 'cop', 'cry', 'cut', 'die', 'dig', 'dim', 'dip',
+               'dry', 'eat', 'end', 'eye', 'fan', 'fax', 'fit', 'fix', 'fly', 'get', 'gun', 'hit',
+               'hop', 'jam', 'jet', 'lap', 'let', 'lie', 'log', 'map', 'mix', 'net', 'pad', 'pan',
+               'pat', 'pay', 'pen', 'pet', 'pin', 'pop', 'pot', 'put', 'ram', 'rap', 'rid', 'rip',
+               'rob', 'row', 'run', 'say', 'see', 'set', 'sip', 'sit', 'ski', 'spy', 'sue', 'tag',
+               'tan', 'tap', 'tie', 'tip', 'top', 'try', 'use', 'wax', 'wed', 'win', 'zip'}
+
+
+def candidate_lemmas(form):
+    """Get the words a form could be an inflection of, most likely first."""
+    candidates = []
+    if len(form) < 4 or form in NOT_INFLECTED:
+        return candidates
+
+    # "...e" lemmas first, so "cases" is "case" rather than "cas"
+    if form.endswith('ies'):
+        candidates.append(form[:-3] + 'y')
+    elif form.endswith('es'):
+        if form[:-2].endswith(('ss', 'x', 'z', 'ch', 'sh')):
+            candidates += [form[:-2], form[:-1]]
+        else:
+            candidates += [form[:-1], form[:-2]]
+    elif form.endswith('s') and not form.endswith('ss'):
+        candidates.append(form[:-1])
+
+    if form.endswith('ied'):
+        candidates.append(form[:-3] + 'y')
+    elif form.endswith('ed'):
+        candidates += [form[:-1], form[:-2]]
+        if doubles_final(form[:-3]):
+            candidates.append(form[:-3])
+
+    if form.endswith('ing') and len(form) > 5:
+        candidates += [form[:-3] + 'e', form[:-3]]
+        if doubles_final(form[:-4]):
+            candidates.append(form[:-4])
+
+    return candidates
+
+
+def doubles_final(word):
+    """Check if a word doubles its last letter before -ed and -ing (stop -> stopped).
+
+    Only one syllable words ending consonant-vowel-consonant do.
+    """
+    vowels = [i for i, letter in enumerate(word) if letter in VOWELS]
+    return (len(word) >= 3 and vowels == [len(word) - 2]
+            and word[-1] not in VOWELS + 'wxy' and word[-3] not in VOWELS)
+
+
+def inflected_from(word, words):
+    """Check if a word is a regular inflection of another word in the list ("titles")."""
+    return any(lemma in words and word in inflect(lemma) for lemma in candidate_lemmas(word))
+
+
+def adverb_from(word, words):
+    """Check if a word is an adverb made from another word in the list ("rapidly")."""
+    if not word.endswith('ly'):
+        return False
+    stems = [word[:-2], word[:-3] + 'y', word[:-4]]
+    return any(len(stem) >= 4 and stem in words for stem in stems)
+
+
+def inflect(word):
+    """Generate the regular inflections of a word."""
+    forms = set()
+    consonant_y = word.endswith('y') and len(word) > 1 and word[-2] not in VOWELS
+    if consonant_y:
+        forms.add(word[:-1] + 'ies')
+    elif word.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        forms.add(word + 'es')
+    else:
+        forms.add(word + 's')
+
+    if len(word) <= 3 and word not in SHORT_VERBS:
+        return forms
+    if doubles_final(word):
+        forms |= {word + word[-1] + 'ed', word + word[-1] + 'ing'}
+        return forms
+
+    if consonant_y:
+        forms.add(word[:-1] + 'ied')
+    else:
+        forms.add(word + 'd' if word.endswith('e') else word + 'ed')
+
+    if word.endswith('e') and not word.endswith('ee'):
+        forms.add(word[:-1] + 'ing')
+    else:
+        forms.add(word + 'ing')
+
+    return forms
+
+
+def build_index(words, forms=None):
+    """Map the inflections of the word list entries back to the entry they came from.
+
+    If forms is given (e.g. the words in a corpus) only those are kept.
+    """
+    words = set(word.lower() for word in words if word)
+
+    index = {}
+    for word in sorted(words):
+        # Skip abbreviations ("str", "cpu") as well as NOT_LEMMAS
+        if word in NOT_LEMMAS or not any(letter in VOWELS + 'y' for letter in word):
+            continue
+        if adverb_from(word, words):
+            continue
+        stem, ing, rest = word.rpartition('ing')
+        if ing and rest in ('', 's') and any(letter in VOWELS + 'y' for letter in stem):
+            # -ing words are only nouns here ("buildings", not "allowinged"
+            # or "earringses")
+            if rest:
+                continue
+            word_forms = {word + 's'}
+        elif inflected_from(word, words):
+            # Inflecting these again makes up words ("titlesing", "passwordses")
+            continue
+        else:
+            word_forms = inflect(word)
+
+        for form in word_forms:
+            if len(form) < 4 or form in NOT_INFLECTED or form == word:
+                continue
+            if forms is not None and form not in forms:
+                continue
+
+            if form in index:
+                # Two words inflect to the same form ("com" and "come" -> "coming")
+                lemmas = candidate_lemmas(form)
+                ranks = [lemmas.index(lemma) if lemma in lemmas else len(lemmas)
+                         for lemma in (word, index[form])]
+                if ranks[0] >= ranks[1]:
+                    continue
+            index[form] = word
+    return index
+
+
+def save_index(index, file_name=INDEX_FILE):
+    """Write the index as a gzipped text file."""
+    with gzip.open(file_name, 'wt') as f:
+        for form in sorted(index):
+            f.write('{} {}\n'.format(form, index[form]))
+
+
+def load_index(file_name=INDEX_FILE):
+    """Read the index into a dict."""
+    with gzip.open(file_name, 'rt') as f:
+        return dict(line.split() for line in f)
+
+
+def main():
+    """Build the index from the word list (and any corpus files given)."""
+    words = get_word_list('no_stop_g2.txt')
+
+    forms = None
+    if len(sys.argv) > 1:
+        forms = set()
+        for file_name in sys.argv[1:]:
+            with open(file_name) as f:
+                forms |= set(re.findall(r'[a-z]+', f.read().lower()))
+
+    index = build_index(words, forms)
+    save_index(index)
+    print('Saved {} forms to {}'.format(len(index), INDEX_FILE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Deferred imports for modules that are slow to load."""
+
+import importlib
+import threading
+
+
+class LazyModule(object):
+    """Stand in for a module, only importing it when first used."""
+
+    def __init__(self, name):
+        """Initialise the parameters"""
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return '<LazyModule {!r}{}>'.format(self._name, '' if self._module is None else ' (loaded)')
+
+
+def preload(names, *functions):
+    """Import modules (then call any functions) in a background thread."""
+    def load():
+        for name in names:
+            importlib.import_module(name)
+        for function in functions:
+            function()
+
+    thread = threading.Thread(target=load, name='preload', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,124 @@
+"""Speculative prefetching of the articles a player is likely to try next."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from article_store import fetch_article, normalise_title
+from request_scheduler import TransientFetchError
+
+
+def lower_priority():
+    """Run the current thread at the lowest scheduling priority (where supported)."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class Prefetcher(object):
+    """Warm the article store in the background.
+
+    Each turn the board words (which often have articles of their own) and
+    the top links from the last article are queued. Anything still queued
+    that is no longer wanted is cancelled when the board changes.
+    """
+
+    def __init__(self, vocabulary, store, max_workers=2, byte_budget=5000000, max_links=10):
+        """Initialise the parameters"""
+        self.vocabulary = vocabulary
+        self.store = store
+        self.byte_budget = byte_budget
+        self.max_links = max_links
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='prefetch',
+                                           initializer=lower_priority)
+
+        self.lock = threading.Lock()
+        self.pending = {}  # normalised title -> Future
+        self.ready = {}  # normalised title -> ArticleCounts, for the current board
+        self.bytes_used = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def update(self, board_words, links=()):
+        """Prefetch for a new board, cancelling anything no longer wanted."""
+        titles = list(board_words) + list(links)[:self.max_links]
+        wanted = {normalise_title(title): title for title in titles}
+
+        with self.lock:
+            self.bytes_used = 0
+            for key in list(self.pending):
+                if key not in wanted and self.pending[key].cancel():
+                    del self.pending[key]
+            self.ready = {key: self.ready[key] for key in self.ready if key in wanted}
+
+            for key, title in wanted.items():
+                if key in self.pending or key in self.ready:
+                    continue
+                self.pending[key] = self.executor.submit(self._fetch, key, title)
+
+    def _fetch(self, key, title):
+        """Fetch an article into the store, unless the byte budget is used up."""
+        with self.lock:
+            if self.bytes_used >= self.byte_budget:
+                self.pending.pop(key, None)
+                return None
+
+        try:
+            article = fetch_article(title, self.vocabulary, self.store)
+        except Exception:
+            with self.lock:
+                self.pending.pop(key, None)
+            raise
+
+        with self.lock:
+            self.pending.pop(key, None)
+            self.ready[key] = article
+            self.bytes_used += article.page_bytes
+        return article
+
+    def get(self, title, timeout=None):
+        """Get an article, using (or waiting for) a prefetch of it if there is one.
+
+        With a timeout, raises TransientFetchError rather than take longer
+        than that many seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        key = normalise_title(title)
+        with self.lock:
+            future = self.pending.get(key)
+            article = self.ready.get(key)
+
+        if article is None and future is not None and not future.cancelled():
+            # None if it was skipped for the byte budget
+            try:
+                article = future.result(timeout)
+            except TimeoutError:
+                raise TransientFetchError('Timed out waiting for {}'.format(title)) from None
+            except Exception:
+                # Fetch it again below, so an old TransientFetchError isn't reported
+                article = None
+
+        if article is not None:
+            self.hits += 1
+            return article
+
+        self.misses += 1
+        return fetch_article(title, self.vocabulary, self.store, deadline=deadline)
+
+    def stats(self):
+        """Get the prefetch hit/miss stats."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'pending': len(self.pending),
+                'ready': len(self.ready),
+                'bytes_used': self.bytes_used,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                }
+
+    def shutdown(self):
+        """Stop prefetching."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -5,6 +5,8 @@ Copyright 2017, Silas Gyger, silasgyger@gmail.com, All rights reserved.
 import pygame
 import pygame.locals as pl
 import os.path
+
+from text_cache import render_text
 pygame.font.init()
 
 
@@ -120,8 +122,8 @@ class TextInput:
                 event_key, event_unicode = key, self.keyrepeat_counters[key][1]
                 pygame.event.post(pygame.event.Event(pl.KEYDOWN, key=event_key, unicode=event_unicode))
 
-        # Rerender text surface:
-        self.surface = self.font_object.render(self.input_string, self.antialias, self.text_color)
+        # Rerender text surface (shared through the cache, so copy before drawing the cursor):
+        self.surface = render_text(self.font_object, self.input_string, self.antialias, self.text_color)
 
         # Update self.cursor_visible
         self.cursor_ms_counter += self.clock.get_time()
@@ -130,6 +132,7 @@ class TextInput:
             self.cursor_visible = not self.cursor_visible
 
         if self.cursor_visible:
+            self.surface = self.surface.copy()
             cursor_y_pos = self.font_object.size(self.input_string[:self.cursor_position])[0]
             # Without this, the cursor is invisible when self.cursor_position > 0:
             if self.cursor_position > 0:
@@ -139,6 +142,12 @@ class TextInput:
         self.clock.tick()
         return False
 
+    def next_update_ms(self):
+        """ms until the surface next changes by itself (0 while a key is repeating)"""
+        if self.keyrepeat_counters:
+            return 0
+        return max(self.cursor_switch_ms - self.cursor_ms_counter, 0)
+
     def get_surface(self):
         return self.surface
 
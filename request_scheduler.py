@@ -0,0 +1,255 @@
+"""Rate limiting, retries and circuit breaking for Wikipedia requests.
+
+Every request goes through a shared RequestScheduler, so all the threads in
+a game (and the prefetcher) share one rate limit per wiki host.
+"""
+
+import email.utils
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# Status codes worth trying again
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TransientFetchError(Exception):
+    """Wikipedia could not be reached right now (the article may still exist)."""
+
+
+def parse_retry_after(value):
+    """Get the seconds to wait from a Retry-After header (seconds or an HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+class TokenBucket(object):
+    """An adaptive token bucket rate limit.
+
+    The rate halves whenever the server says it is overloaded and creeps
+    back up with each success, so it settles near the fastest rate the
+    server accepts.
+    """
+
+    def __init__(self, rate, burst, min_rate=0.5):
+        """Initialise the parameters"""
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.slowed = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, max_wait=None):
+        """Wait for a token, returning the seconds waited (None if over max_wait)."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve a token now, even if it has to be waited for
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            if max_wait is not None and wait > max_wait:
+                # Not worth waiting for, so give it back
+                self.tokens += 1
+                return None
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def hold(self, seconds):
+        """Stop handing out tokens for some seconds."""
+        with self.lock:
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def slow_down(self):
+        """Halve the rate (once a second at most, so a burst of errors only counts once)."""
+        with self.lock:
+            now = time.monotonic()
+            if now - self.slowed >= 1.0:
+                self.rate = max(self.rate / 2, self.min_rate)
+                self.slowed = now
+
+    def speed_up(self):
+        """Increase the rate a little, up to the maximum."""
+        with self.lock:
+            self.rate = min(self.rate + self.max_rate / 50, self.max_rate)
+
+
+class CircuitBreaker(object):
+    """Stop sending requests to a host after repeated failures.
+
+    Once open, a single trial request is let through after the cooldown;
+    the circuit closes again if it succeeds, opens again if it fails, and
+    lets another trial through if it ends any other way (e.g. a 429).
+    """
+
+    def __init__(self, threshold=5, cooldown=30):
+        """Initialise the parameters"""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = None
+        # Thread sending the trial request, if there is one
+        self.trial = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """Check if a request may be sent."""
+        with self.lock:
+            if self.opened is None:
+                return True
+            if self.trial is None and time.monotonic() - self.opened >= self.cooldown:
+                self.trial = threading.get_ident()
+                return True
+            return False
+
+    def record_success(self):
+        """Close the circuit."""
+        with self.lock:
+            self.failures = 0
+            self.opened = None
+            self.trial = None
+
+    def record_failure(self):
+        """Count a failure, opening the circuit if there have been too many."""
+        with self.lock:
+            self.failures += 1
+            if self.trial is not None or self.failures >= self.threshold:
+                self.opened = time.monotonic()
+                self.trial = None
+
+    def end_trial(self):
+        """Let another trial through if this thread's trial ended without a verdict."""
+        with self.lock:
+            if self.trial == threading.get_ident():
+                self.trial = None
+
+
+class RequestScheduler(object):
+    """Fetch URLs with per-host rate limits, jittered backoff and circuit breaking."""
+
+    def __init__(self, rate=10.0, burst=10, retries=4, backoff=0.5, max_backoff=30.0,
+                 timeout=10.0, failure_threshold=5, cooldown=30.0):
+        """Initialise the parameters"""
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+        self.requests = 0
+        self.retried = 0
+
+    def host(self, host):
+        """Get the rate limit and circuit breaker for a host."""
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = (TokenBucket(self.rate, self.burst),
+                                    CircuitBreaker(self.failure_threshold, self.cooldown))
+            return self.hosts[host]
+
+    def delay(self, attempt):
+        """Get the time to wait before a retry ("full jitter" exponential backoff)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def fetch(self, url, deadline=None):
+        """Get the body of a URL.
+
+        Raises HTTPError for errors that retrying won't fix (e.g. 404), and
+        TransientFetchError once the retries run out, the circuit is open or
+        the deadline (a time.monotonic() time) would be missed.
+        """
+        bucket, breaker = self.host(urllib.parse.urlsplit(url).netloc)
+
+        def time_left():
+            return None if deadline is None else deadline - time.monotonic()
+
+        error = None
+        for attempt in range(self.retries + 1):
+            if not breaker.allow():
+                raise TransientFetchError('Too many recent failures for {}'.format(url)) from error
+
+            try:
+                if bucket.acquire(time_left()) is None:
+                    raise TransientFetchError('Out of time to fetch {}'.format(url)) from error
+                self.requests += 1
+                retry_after = None
+                timeout = self.timeout
+                if deadline is not None:
+                    timeout = max(min(timeout, time_left()), 0.01)
+                try:
+                    with urllib.request.urlopen(url, timeout=timeout) as response:
+                        data = response.read()
+                except urllib.error.HTTPError as http_error:
+                    if http_error.code not in RETRY_STATUSES:
+                        # The server is working, the page just isn't there
+                        breaker.record_success()
+                        raise
+                    error = http_error
+                    retry_after = parse_retry_after(http_error.headers.get('Retry-After'))
+                    if http_error.code == 429:
+                        # Too fast rather than broken, so don't trip the breaker
+                        bucket.slow_down()
+                except (urllib.error.URLError, OSError) as url_error:
+                    # Includes timeouts and refused connections
+                    error = url_error
+                else:
+                    breaker.record_success()
+                    bucket.speed_up()
+                    return data
+
+                if getattr(error, 'code', None) != 429:
+                    breaker.record_failure()
+                if attempt == self.retries or (retry_after or 0) > self.max_backoff:
+                    break
+                if retry_after is not None:
+                    # Every request to the host waits, not just this one
+                    bucket.hold(retry_after)
+                    wait = 0.0
+                else:
+                    wait = self.delay(attempt)
+                if deadline is not None and (retry_after or wait) >= time_left():
+                    break
+                self.retried += 1
+                time.sleep(wait)
+            finally:
+                # Whatever happened, don't leave a trial hanging
+                breaker.end_trial()
+
+        raise TransientFetchError('Could not fetch {}: {}'.format(url, error)) from error
+
+    def stats(self):
+        """Get the request stats."""
+        return {'requests': self.requests,
+                'retried': self.retried,
+                'rates': {host: bucket.rate for host, (bucket, _) in self.hosts.items()},
+                }
+
+
+SCHEDULER = RequestScheduler()
+
+
+def fetch_url(url, deadline=None):
+    """Fetch a URL through the shared scheduler."""
+    return SCHEDULER.fetch(url, deadline)
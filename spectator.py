@@ -0,0 +1,390 @@
+"""A live feed of the game state for spectators, on a local socket.
+
+The game publishes each change as a small binary message, encoded once and
+queued (by reference) for every connected spectator. New spectators get a
+snapshot of the board first. Each message is a header of type and payload
+length, then the payload (all integers big-endian):
+
+    SNAPSHOT  size, score, final score (-1 if none), (count, limit) for each
+              tile, then the tile words joined by newlines
+    COUNTS    (x, y, count) for each tile that changed
+    WORD      x, y, limit, then the new word (after an overflow)
+    SCORE     score
+    WIN       final score
+
+Run this file to watch a game from the terminal:
+
+    python spectator.py [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import selectors
+import socket
+import struct
+import threading
+from collections import deque
+
+from lazy_import import LazyModule
+
+np = LazyModule('numpy')
+
+SPECTATOR_PORT = 8765
+
+SNAPSHOT, COUNTS, WORD, SCORE, WIN = range(5)
+
+HEADER = struct.Struct('!BI')
+SNAPSHOT_HEADER = struct.Struct('!HIi')
+WORD_HEADER = struct.Struct('!HHH')
+SCORE_FORMAT = struct.Struct('!I')
+CELL_DTYPE = '>u2'
+
+
+def message(kind, payload=b''):
+    """Add the header to a message payload."""
+    return HEADER.pack(kind, len(payload)) + payload
+
+
+def encode_snapshot(words, counts, limits, score, final_score=None):
+    """Encode the whole board."""
+    size = len(words)
+    cells = np.stack([np.asarray(counts), np.asarray(limits)], axis=-1).astype(CELL_DTYPE)
+    payload = (SNAPSHOT_HEADER.pack(size, score, -1 if final_score is None else final_score)
+               + cells.tobytes()
+               + '\n'.join(str(word) for word in np.asarray(words).flatten()).encode('utf-8'))
+    return message(SNAPSHOT, payload)
+
+
+def encode_board(board, score, final_score=None):
+    """Encode a Board."""
+    return encode_snapshot(board.words, board.counts, board.limits, score, final_score)
+
+
+def encode_turn(updates, score):
+    """Encode the TileUpdates from an article and the new score as one buffer."""
+    data = []
+    if updates:
+        cells = np.array([(update.x, update.y, 0 if update.new_word else update.total)
+                          for update in updates], dtype=CELL_DTYPE)
+        data.append(message(COUNTS, cells.tobytes()))
+    for update in updates:
+        if update.new_word:
+            data.append(message(WORD, WORD_HEADER.pack(update.x, update.y, update.limit)
+                                + update.new_word.encode('utf-8')))
+    data.append(message(SCORE, SCORE_FORMAT.pack(score)))
+    return b''.join(data)
+
+
+def encode_win(final_score):
+    """Encode the end of the game."""
+    return message(WIN, SCORE_FORMAT.pack(final_score))
+
+
+class MessageReader(object):
+    """Split a byte stream back into (kind, payload) messages."""
+
+    def __init__(self):
+        """Initialise the parameters"""
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """Add some bytes, returning the messages completed by them."""
+        self.buffer += data
+        messages = []
+        start = 0
+        while len(self.buffer) - start >= HEADER.size:
+            kind, length = HEADER.unpack_from(self.buffer, start)
+            end = start + HEADER.size + length
+            if end > len(self.buffer):
+                break
+            messages.append((kind, bytes(self.buffer[start + HEADER.size:end])))
+            start = end
+        del self.buffer[:start]
+        return messages
+
+
+class BoardState(object):
+    """The board as seen by a spectator, rebuilt from the messages."""
+
+    def __init__(self):
+        """Initialise the parameters"""
+        self.size = 0
+        self.words = None
+        self.counts = None
+        self.limits = None
+        self.score = 0
+        self.final_score = None
+
+    def apply(self, kind, payload):
+        """Update the state from one message."""
+        if kind == SNAPSHOT:
+            size, self.score, final_score = SNAPSHOT_HEADER.unpack_from(payload)
+            self.final_score = None if final_score < 0 else final_score
+            self.size = size
+            end = SNAPSHOT_HEADER.size + size * size * 4
+            cells = np.frombuffer(payload[SNAPSHOT_HEADER.size:end], dtype=CELL_DTYPE)
+            cells = cells.reshape((size, size, 2)).astype(int)
+            self.counts = cells[:, :, 0]
+            self.limits = cells[:, :, 1]
+            words = payload[end:].decode('utf-8').split('\n')
+            self.words = np.array(words, dtype=object).reshape((size, size))
+        elif kind == COUNTS:
+            cells = np.frombuffer(payload, dtype=CELL_DTYPE).reshape((-1, 3)).astype(int)
+            self.counts[cells[:, 0], cells[:, 1]] = cells[:, 2]
+        elif kind == WORD:
+            x, y, limit = WORD_HEADER.unpack_from(payload)
+            self.words[x, y] = payload[WORD_HEADER.size:].decode('utf-8')
+            self.limits[x, y] = limit
+        elif kind == SCORE:
+            self.score, = SCORE_FORMAT.unpack(payload)
+        elif kind == WIN:
+            self.final_score, = SCORE_FORMAT.unpack(payload)
+
+    def snapshot(self):
+        """Encode the current state for a new spectator (None before the first board)."""
+        if self.words is None:
+            return None
+        return encode_snapshot(self.words, self.counts, self.limits, self.score,
+                               self.final_score)
+
+    def render(self):
+        """Draw the board as text."""
+        if self.words is None:
+            return 'Waiting for a game...'
+        width = max(len(word) for word in self.words.flatten()) + 6
+        rows = []
+        for y in range(self.size):
+            rows.append(''.join('{} {}/{}'.format(self.words[x, y], self.counts[x, y],
+                                                  self.limits[x, y]).ljust(width)
+                                for x in range(self.size)))
+        rows.append('COUNT: {}'.format(self.score))
+        if self.final_score is not None:
+            rows.append('FINAL SCORE: {}'.format(self.final_score))
+        return '\n'.join(rows)
+
+
+class Subscriber(object):
+    """A connected spectator's queue of messages still to send."""
+
+    def __init__(self, sock):
+        """Initialise the parameters"""
+        self.sock = sock
+        self.queue = deque()
+        self.queued = 0
+
+
+class SpectatorServer(object):
+    """Serve the game state to any number of spectators from a background thread.
+
+    Messages are encoded once by the game and the same bytes are queued for
+    every spectator, so the game's cost per update doesn't grow with the
+    audience. Spectators that fall more than max_backlog bytes behind are
+    disconnected (they can reconnect for a fresh snapshot).
+    """
+
+    def __init__(self, port=SPECTATOR_PORT, host='127.0.0.1', max_backlog=1 << 20):
+        """Initialise the parameters"""
+        self.max_backlog = max_backlog
+        self.listener = socket.create_server((host, port))
+        self.listener.setblocking(False)
+        self.port = self.listener.getsockname()[1]
+
+        # Written to by publish() to wake the server thread
+        self.wake_recv, self.wake_send = socket.socketpair()
+        self.wake_recv.setblocking(False)
+        self.wake_send.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.selector.register(self.wake_recv, selectors.EVENT_READ)
+
+        self.state = BoardState()
+        self.subscribers = {}
+        self.lock = threading.RLock()
+        self.dropped = 0
+
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, name='spectator', daemon=True)
+        self.thread.start()
+
+    def publish(self, data):
+        """Send some encoded messages to every spectator."""
+        with self.lock:
+            for kind, payload in MessageReader().feed(data):
+                self.state.apply(kind, payload)
+            for subscriber in self.subscribers.values():
+                subscriber.queue.append(data)
+                subscriber.queued += len(data)
+        self.wake()
+
+    def publish_board(self, board, score, final_score=None):
+        """Send a whole new board."""
+        self.publish(encode_board(board, score, final_score))
+
+    def publish_turn(self, updates, score):
+        """Send the changes from an article."""
+        self.publish(encode_turn(updates, score))
+
+    def publish_win(self, final_score):
+        """Send the final score."""
+        self.publish(encode_win(final_score))
+
+    def wake(self):
+        """Wake the server thread."""
+        try:
+            self.wake_send.send(b'\0')
+        except BlockingIOError:
+            # Already woken
+            pass
+
+    def serve(self):
+        """Accept spectators and send them their messages until closed."""
+        while self.running:
+            for key, events in self.selector.select():
+                sock = key.fileobj
+                if sock is self.listener:
+                    self.accept()
+                elif sock is self.wake_recv:
+                    try:
+                        while self.wake_recv.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    if events & selectors.EVENT_READ:
+                        # Spectators don't send anything, so this is a disconnect
+                        try:
+                            data = sock.recv(4096)
+                        except OSError:
+                            data = b''
+                        if not data:
+                            self.drop(sock)
+                            continue
+                    if events & selectors.EVENT_WRITE:
+                        self.flush(sock)
+
+            with self.lock:
+                waiting = [sock for sock, subscriber in self.subscribers.items()
+                           if subscriber.queue]
+            for sock in waiting:
+                self.flush(sock)
+
+    def accept(self):
+        """Accept a new spectator, starting them with a snapshot."""
+        try:
+            sock, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        subscriber = Subscriber(sock)
+        with self.lock:
+            snapshot = self.state.snapshot()
+            if snapshot is not None:
+                subscriber.queue.append(snapshot)
+                subscriber.queued = len(snapshot)
+            self.subscribers[sock] = subscriber
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def flush(self, sock):
+        """Send as much of a spectator's queue as the socket will take."""
+        with self.lock:
+            subscriber = self.subscribers.get(sock)
+            if subscriber is None:
+                return
+            if subscriber.queued > self.max_backlog:
+                self.dropped += 1
+                self.drop(sock)
+                return
+
+            queue = subscriber.queue
+            while queue:
+                try:
+                    sent = sock.send(queue[0])
+                except BlockingIOError:
+                    break
+                except OSError:
+                    self.drop(sock)
+                    return
+                subscriber.queued -= sent
+                if sent < len(queue[0]):
+                    queue[0] = memoryview(queue[0])[sent:]
+                    break
+                queue.popleft()
+
+            events = selectors.EVENT_READ
+            if queue:
+                events |= selectors.EVENT_WRITE
+            self.selector.modify(sock, events)
+
+    def drop(self, sock):
+        """Disconnect a spectator."""
+        with self.lock:
+            self.subscribers.pop(sock, None)
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+
+    def stats(self):
+        """Get the spectator stats."""
+        return {'port': self.port,
+                'spectators': len(self.subscribers),
+                'dropped': self.dropped,
+                }
+
+    def close(self):
+        """Disconnect everyone and stop the server thread."""
+        self.running = False
+        self.wake()
+        self.thread.join()
+        for sock in list(self.subscribers):
+            self.drop(sock)
+        self.selector.close()
+        for sock in (self.listener, self.wake_recv, self.wake_send):
+            sock.close()
+
+
+class Spectator(object):
+    """A reference spectator, rebuilding the board without a display."""
+
+    def __init__(self, host='127.0.0.1', port=SPECTATOR_PORT, timeout=None):
+        """Initialise the parameters"""
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.reader = MessageReader()
+        self.state = BoardState()
+
+    def receive(self):
+        """Apply whatever arrives next, returning False once the game has gone."""
+        data = self.sock.recv(65536)
+        if not data:
+            return False
+        for kind, payload in self.reader.feed(data):
+            self.state.apply(kind, payload)
+        return True
+
+    def close(self):
+        """Disconnect."""
+        self.sock.close()
+
+
+def main():
+    """Watch a game, printing the board after every change."""
+    parser = argparse.ArgumentParser(description='Watch a game of Wikipedia Bingo')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=SPECTATOR_PORT)
+    args = parser.parse_args()
+
+    spectator = Spectator(args.host, args.port)
+    print(spectator.state.render())
+    try:
+        while spectator.receive():
+            print('\n' + spectator.state.render(), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        spectator.close()
+
+
+if __name__ == '__main__':
+    main()
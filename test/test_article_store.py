@@ -0,0 +1,66 @@
+import unittest as un
+import os
+import tempfile
+from unittest import mock
+import numpy as np
+import word_generation as wn
+import vocabulary as vc
+import article_store as ast
+
+class TestArticleStore(un.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+        self.store = ast.ArticleStore(self.dir.name, self.vocab, max_entries=10)
+        self.article = self.vocab.count(['germany', 'germany', 'music'])
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip(self):
+        """Test stored counts are read back under the normalised title"""
+        self.assertIsNone(self.store.get('Ice Cream'))
+        self.store.put('Ice Cream', self.article)
+        article = self.store.get(' ice_cream')
+        np.testing.assert_array_equal(article.ids, self.article.ids)
+        np.testing.assert_array_equal(article.counts, self.article.counts)
+        self.assertEqual(self.store.stats()['hits'], 1)
+
+    def test_version(self):
+        """Test entries from a different word list are ignored"""
+        self.store.put('Ice', self.article)
+        other = ast.ArticleStore(self.dir.name, vc.Vocabulary(['germany', 'music']))
+        self.assertIsNone(other.get('Ice'))
+
+    def test_eviction(self):
+        """Test the store stays within its size"""
+        for i in range(15):
+            self.store.put('title {}'.format(i), self.article)
+        self.assertLessEqual(self.store.entries, 10)
+        self.assertIsNotNone(self.store.get('title 14'))
+
+    def test_fetch_from_store(self):
+        """Test a stored title is not fetched again"""
+        self.store.put('Ice', self.article)
+        article = ast.fetch_article('ice', self.vocab, self.store)
+        np.testing.assert_array_equal(article.ids, self.article.ids)
+
+    def test_failed_put(self):
+        """Test a failed write leaves no temporary file, and the article is still returned"""
+        with mock.patch.object(ast.os, 'replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.store.put('Ice', self.article)
+            self.assertEqual(os.listdir(self.dir.name), [])
+
+            validation = mock.Mock()
+            validation.count_words.return_value = self.article
+            with mock.patch.object(ast, 'Validation', return_value=validation), \
+                    mock.patch('sys.stderr'):
+                article = ast.fetch_article('ice', self.vocab, self.store)
+        self.assertIs(article, self.article)
+        self.assertIsNone(self.store.get('Ice'))
+
+
+if __name__ == '__main__':
+    un.main()
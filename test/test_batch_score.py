@@ -0,0 +1,104 @@
+import unittest as un
+import csv
+import io
+import tempfile
+from unittest import mock
+import numpy as np
+import word_generation as wn
+import vocabulary as vc
+import request_scheduler as rs
+from board import Board
+import batch_score as bs
+
+
+class TestBatchScore(un.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.scheduler = rs.SCHEDULER
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+        self.fetched = []
+
+    def tearDown(self):
+        rs.SCHEDULER = self.scheduler
+        bs.WORKER.clear()
+        self.dir.cleanup()
+
+    def fake_fetch(self, title, vocabulary, store=None, mode_choice=0, refresh=False):
+        """Articles just mention their own title (twice for 'double ...')"""
+        self.fetched.append(title)
+        if title == 'missing':
+            raise ValueError('Article not found')
+        if title == 'busy':
+            raise rs.TransientFetchError('busy')
+        if title.startswith('double '):
+            return vocabulary.count([title[7:]] * 2)
+        return vocabulary.count([title])
+
+    def score(self, submissions):
+        with mock.patch.object(bs, 'fetch_article', self.fake_fetch):
+            return bs.score_all(submissions, self.dir.name, workers=0,
+                                match_inflections=False, out=io.StringIO())
+
+    def test_seed(self):
+        """Test a seed always gives the same board, including overflow words"""
+        boards = [Board(5, 3, self.vocab, seed=42) for _ in range(2)]
+        article = self.vocab.count([boards[0].words[0, 0]] * 3)
+        for board in boards:
+            board.apply_article(article)
+        np.testing.assert_array_equal(boards[0].words, boards[1].words)
+        self.assertNotEqual(boards[0].words[0, 0], Board(5, 3, self.vocab, seed=43).words[0, 0])
+
+    def test_score(self):
+        """Test submissions are played like the game"""
+        words = list(Board(3, 3, self.vocab, seed=7).words[0])
+        submissions = [
+            {'name': 'quick', 'seed': 7, 'board_size': 3, 'limit': 3, 'titles': words + ['extra']},
+            {'name': 'slow', 'seed': 7, 'board_size': 3, 'limit': 3,
+             'titles': ['missing'] + [w.upper() for w in words]},
+            {'name': 'unfinished', 'seed': 7, 'board_size': 3, 'limit': 3,
+             'titles': words[:2]},
+            {'name': 'busy', 'seed': 7, 'titles': ['busy']},
+            {'name': 'broken', 'titles': words},
+        ]
+        results = self.score(submissions)
+
+        self.assertEqual(results[0], ('quick', 1500, 3, None))
+        self.assertEqual(results[1], ('slow', 1200, 4, None))
+        self.assertEqual(results[2], ('unfinished', None, 2, None))
+        self.assertIsNotNone(results[3][3])
+        self.assertIsNotNone(results[4][3])
+        # Articles are only fetched once per worker, and not after a win
+        self.assertNotIn('extra', self.fetched)
+        self.assertEqual(self.fetched.count(words[0]), 1)
+
+        file_name = self.dir.name + '/tournament.csv'
+        bs.write_leaderboard(results, file_name)
+        with open(file_name) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([(row['name'], row['score']) for row in rows],
+                         [('quick', '1500'), ('slow', '1200')])
+
+    def test_overflow(self):
+        """Test overflowed tiles are replaced by the same words as in the game"""
+        board = Board(3, 3, self.vocab, seed=11)
+        first = board.words[0, 0]
+        board.apply_article(self.vocab.count([first] * 2))
+        board.apply_article(self.vocab.count([first]))
+        titles = ['double ' + first, first] + list(board.words[0])
+        results = self.score([{'name': 'a', 'seed': 11, 'board_size': 3, 'limit': 3,
+                               'titles': titles}])
+        self.assertEqual(results[0], ('a', 1000, 5, None))
+
+    def test_article_limit(self):
+        """Test each worker only keeps the most recent articles in memory"""
+        words = list(Board(3, 3, self.vocab, seed=7).words.flatten())
+        with mock.patch.object(bs, 'MAX_ARTICLES', 2):
+            self.score([{'name': 'a', 'seed': 7, 'board_size': 3, 'limit': 3,
+                         'titles': [words[0], words[1], words[3], words[0]]}])
+        self.assertEqual(list(bs.WORKER['articles']), [words[3], words[0]])
+        self.assertEqual(self.fetched.count(words[0]), 2)
+
+
+if __name__ == '__main__':
+    un.main()
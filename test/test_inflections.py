@@ -0,0 +1,67 @@
+import unittest as un
+import word_generation as wn
+import vocabulary as vc
+import inflections as inf
+
+class TestInflections(un.TestCase):
+
+    def setUp(self):
+        self.words = wn.get_word_list('no_stop_g2.txt')
+
+    def test_candidates(self):
+        """Test undoing regular inflections"""
+        self.assertEqual(inf.candidate_lemmas('countries')[0], 'country')
+        self.assertEqual(inf.candidate_lemmas('boxes')[0], 'box')
+        self.assertIn('stop', inf.candidate_lemmas('stopped'))
+        self.assertIn('make', inf.candidate_lemmas('making'))
+        self.assertEqual(inf.candidate_lemmas('news'), [])
+
+    def test_candidate_order(self):
+        """Test "...e" lemmas come before bare stems"""
+        self.assertEqual(inf.candidate_lemmas('cases')[0], 'case')
+        self.assertEqual(inf.candidate_lemmas('coding')[0], 'code')
+        self.assertEqual(inf.candidate_lemmas('hated')[0], 'hate')
+        self.assertNotIn('bi', inf.candidate_lemmas('biting'))
+        self.assertIn('run', inf.candidate_lemmas('running'))
+
+    def test_build_from_word_list(self):
+        """Test forms map back to the word that made them, and real words are left alone"""
+        index = inf.build_index(self.words)
+        for form, word in [('cases', 'case'), ('coming', 'come'), ('coding', 'code'),
+                           ('caring', 'care'), ('biting', 'bite'), ('stopped', 'stop'),
+                           ('making', 'make'), ('telling', 'tell'), ('countries', 'country'),
+                           ('running', 'run'), ('buildings', 'building')]:
+            self.assertEqual(index.get(form), word, form)
+        for form in ['united', 'evening', 'seed', 'string', 'wedding', 'does', 'doing', 'deed',
+                     'sting', 'caming', 'camed', 'anning', 'allowinged', 'titlesing',
+                     'passwordses', 'rapidlied', 'cpued']:
+            self.assertNotIn(form, index)
+
+        # Every generated form maps back to a word that generates it
+        for form, word in index.items():
+            self.assertIn(form, inf.inflect(word))
+
+    def test_build_from_corpus(self):
+        """Test only corpus forms of listed words are indexed"""
+        index = inf.build_index(self.words, {'wars', 'played', 'xyzzies', 'war'})
+        self.assertEqual(index, {'wars': 'war', 'played': 'play'})
+
+    def test_vocabulary(self):
+        """Test inflected forms count towards their word when switched on"""
+        index = inf.build_index(self.words)
+        tokens = ['Countries', 'country', 'wars', 'played']
+        on = vc.Vocabulary(self.words, index)
+        off = vc.Vocabulary(self.words)
+        country = [on.word_id('country'), on.word_id('countries'), on.word_id('war')]
+        self.assertEqual(list(on.count(tokens).lookup(country)), [2, 1, 1])
+        self.assertEqual(list(off.count(tokens).lookup(country)), [1, 1, 0])
+
+    def test_shipped_index(self):
+        """Test the shipped index loads"""
+        index = inf.load_index('../' + inf.INDEX_FILE)
+        self.assertEqual(index['wars'], 'war')
+        self.assertEqual(index, inf.build_index(self.words))
+
+
+if __name__ == '__main__':
+    un.main()
@@ -0,0 +1,99 @@
+import unittest as un
+import threading
+import time
+import word_generation as wn
+import vocabulary as vc
+import prefetch as pf
+import request_scheduler as rs
+
+class TestPrefetch(un.TestCase):
+
+    def setUp(self):
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+        self.fetched = []
+        self.release = threading.Event()
+        self.release.set()
+        self.fetch_article = pf.fetch_article
+        pf.fetch_article = self.fake_fetch
+
+    def tearDown(self):
+        pf.fetch_article = self.fetch_article
+
+    def fake_fetch(self, title, vocabulary, store=None, mode_choice=0, deadline=None):
+        self.release.wait(5)
+        self.fetched.append(title)
+        if title == 'busy' and self.fetched.count(title) == 1:
+            raise rs.TransientFetchError('Wikipedia is busy')
+        article = vocabulary.count([title])
+        article.page_bytes = 1000
+        return article
+
+    def test_hit(self):
+        """Test prefetched titles count as hits and are not fetched twice"""
+        prefetcher = pf.Prefetcher(self.vocab, None)
+        prefetcher.update(['germany', 'music'])
+        prefetcher.executor.shutdown(wait=True)
+        prefetcher.get('Germany')
+        prefetcher.get('poison')
+        self.assertEqual(sorted(self.fetched), ['germany', 'music', 'poison'])
+        self.assertEqual(prefetcher.stats()['hit_rate'], 0.5)
+
+    def test_cancel_stale(self):
+        """Test queued titles are dropped when the board changes"""
+        self.release.clear()
+        prefetcher = pf.Prefetcher(self.vocab, None, max_workers=1)
+        prefetcher.update(['germany', 'music', 'poison'])
+        prefetcher.update(['germany', 'news'])
+        self.release.set()
+        prefetcher.executor.shutdown(wait=True)
+        self.assertEqual(self.fetched, ['germany', 'news'])
+
+    def test_byte_budget(self):
+        """Test prefetching stops once the budget is used"""
+        prefetcher = pf.Prefetcher(self.vocab, None, max_workers=1, byte_budget=1500)
+        prefetcher.update(['germany', 'music', 'poison'])
+        prefetcher.executor.shutdown(wait=True)
+        self.assertEqual(len(self.fetched), 2)
+
+    def test_budget_miss(self):
+        """Test waiting on a prefetch skipped for the budget counts as a miss"""
+        self.release.clear()
+        prefetcher = pf.Prefetcher(self.vocab, None, max_workers=1, byte_budget=500)
+        prefetcher.update(['germany', 'music'])
+        threading.Timer(0.1, self.release.set).start()
+        prefetcher.get('music')
+        self.assertEqual(self.fetched, ['germany', 'music'])
+        self.assertEqual((prefetcher.hits, prefetcher.misses), (0, 1))
+
+    def test_failed_prefetch(self):
+        """Test a prefetch that raised counts as a miss and is fetched again"""
+        self.release.clear()
+        prefetcher = pf.Prefetcher(self.vocab, None, max_workers=1)
+        prefetcher.update(['busy'])
+        threading.Timer(0.1, self.release.set).start()
+        self.assertIsNotNone(prefetcher.get('busy'))
+        self.assertEqual(self.fetched, ['busy', 'busy'])
+        self.assertEqual((prefetcher.hits, prefetcher.misses), (0, 1))
+
+    def test_timeout(self):
+        """Test waiting on a slow prefetch gives up after the timeout"""
+        self.release.clear()
+        prefetcher = pf.Prefetcher(self.vocab, None, max_workers=1)
+        prefetcher.update(['germany'])
+        start = time.monotonic()
+        with self.assertRaises(rs.TransientFetchError):
+            prefetcher.get('germany', timeout=0.1)
+        self.assertLess(time.monotonic() - start, 1)
+        self.release.set()
+        prefetcher.executor.shutdown(wait=True)
+
+    def test_links(self):
+        """Test only the top links are prefetched"""
+        prefetcher = pf.Prefetcher(self.vocab, None, max_links=1)
+        prefetcher.update([], ['Germany', 'Music'])
+        prefetcher.executor.shutdown(wait=True)
+        self.assertEqual(self.fetched, ['Germany'])
+
+
+if __name__ == '__main__':
+    un.main()
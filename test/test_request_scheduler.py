@@ -0,0 +1,164 @@
+import unittest as un
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import request_scheduler as rs
+
+class FakeWiki(BaseHTTPRequestHandler):
+    """Serve pages, failing the first few requests for each path as asked"""
+
+    # path -> list of (status, headers) to send before succeeding
+    errors = {}
+    hits = {}
+    # Requests per second allowed under /limit/
+    limit = 20
+    recent = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        FakeWiki.hits[self.path] = FakeWiki.hits.get(self.path, 0) + 1
+        queue = FakeWiki.errors.get(self.path, [])
+        if self.path.startswith('/limit/'):
+            now = time.monotonic()
+            with FakeWiki.lock:
+                FakeWiki.recent = [t for t in FakeWiki.recent if now - t < 1]
+                allowed = len(FakeWiki.recent) < FakeWiki.limit
+                if allowed:
+                    FakeWiki.recent.append(now)
+            status, headers = (200, {}) if allowed else (429, {'Retry-After': '0.2'})
+        elif self.path == '/missing':
+            status, headers = 404, {}
+        elif self.path == '/down':
+            status, headers = 503, {}
+        elif queue:
+            status, headers = queue.pop(0)
+        else:
+            status, headers = 200, {}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(b'page' if status == 200 else b'error')
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRequestScheduler(un.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeWiki)
+        cls.url = 'http://127.0.0.1:{}'.format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        FakeWiki.errors = {}
+        FakeWiki.hits = {}
+        self.scheduler = rs.RequestScheduler(rate=100, burst=100, backoff=0.01,
+                                             failure_threshold=3, cooldown=60)
+
+    def test_retry(self):
+        """Test 503s are retried until the page loads"""
+        FakeWiki.errors['/flaky'] = [(503, {}), (502, {})]
+        self.assertEqual(self.scheduler.fetch(self.url + '/flaky'), b'page')
+        self.assertEqual(FakeWiki.hits['/flaky'], 3)
+
+    def test_retry_after(self):
+        """Test Retry-After is honoured and slows the host down"""
+        FakeWiki.errors['/limited'] = [(429, {'Retry-After': '0.3'})]
+        start = time.monotonic()
+        self.assertEqual(self.scheduler.fetch(self.url + '/limited'), b'page')
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        self.assertLess(list(self.scheduler.stats()['rates'].values())[0], 100)
+
+    def test_not_found(self):
+        """Test a 404 is not retried"""
+        with self.assertRaises(urllib.error.HTTPError):
+            self.scheduler.fetch(self.url + '/missing')
+        self.assertEqual(FakeWiki.hits['/missing'], 1)
+
+    def test_circuit_breaker(self):
+        """Test requests stop after repeated failures"""
+        with self.assertRaises(rs.TransientFetchError):
+            self.scheduler.fetch(self.url + '/down')
+        with self.assertRaises(rs.TransientFetchError):
+            self.scheduler.fetch(self.url + '/other')
+        self.assertEqual(FakeWiki.hits.get('/down'), 3)
+        self.assertNotIn('/other', FakeWiki.hits)
+
+    def open_breaker(self):
+        """Fail enough requests to open the circuit, then wait out the cooldown"""
+        scheduler = rs.RequestScheduler(rate=100, burst=100, backoff=0.01,
+                                        failure_threshold=3, cooldown=0.1)
+        FakeWiki.errors['/trial'] = [(503, {})] * 3
+        with self.assertRaises(rs.TransientFetchError):
+            scheduler.fetch(self.url + '/trial')
+        time.sleep(0.15)
+        return scheduler
+
+    def test_trial_rate_limited(self):
+        """Test the circuit still closes when the trial request gets a 429"""
+        scheduler = self.open_breaker()
+        FakeWiki.errors['/trial'] = [(429, {'Retry-After': '0'})]
+        self.assertEqual(scheduler.fetch(self.url + '/trial'), b'page')
+        self.assertEqual(scheduler.fetch(self.url + '/other'), b'page')
+
+    def test_trial_error(self):
+        """Test the circuit still closes after a trial request raises"""
+        scheduler = self.open_breaker()
+        with self.assertRaises(UnicodeEncodeError):
+            scheduler.fetch(self.url + '/S\u00e3o_Paulo')
+        self.assertEqual(scheduler.fetch(self.url + '/other'), b'page')
+
+    def test_deadline(self):
+        """Test retries and Retry-After waits stop at the deadline"""
+        scheduler = rs.RequestScheduler(rate=100, burst=100, backoff=1.0, max_backoff=1.0)
+        FakeWiki.errors['/slow'] = [(429, {'Retry-After': '2'})]
+        start = time.monotonic()
+        for path in ['/slow', '/down']:
+            with self.assertRaises(rs.TransientFetchError):
+                scheduler.fetch(self.url + path, deadline=time.monotonic() + 0.3)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(FakeWiki.hits['/slow'], 1)
+
+    def test_deadline_rate_limit(self):
+        """Test a token that would arrive after the deadline isn't waited for"""
+        scheduler = rs.RequestScheduler(rate=1, burst=1)
+        scheduler.fetch(self.url + '/first')
+        with self.assertRaises(rs.TransientFetchError):
+            scheduler.fetch(self.url + '/second', deadline=time.monotonic() + 0.1)
+        self.assertNotIn('/second', FakeWiki.hits)
+
+    def test_overloaded_server(self):
+        """Test a server with a lower rate limit gets everything without tripping the breaker"""
+        scheduler = rs.RequestScheduler(rate=60, burst=5, backoff=0.01, failure_threshold=3)
+        urls = ['{}/limit/{}'.format(self.url, i) for i in range(60)]
+        with ThreadPoolExecutor(4) as executor:
+            pages = list(executor.map(scheduler.fetch, urls))
+        self.assertEqual(pages, [b'page'] * 60)
+        self.assertLess(scheduler.stats()['retried'], 60)
+
+    def test_rate_limit(self):
+        """Test the token bucket paces requests"""
+        bucket = rs.TokenBucket(rate=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_parse_retry_after(self):
+        """Test both forms of Retry-After"""
+        self.assertEqual(rs.parse_retry_after('120'), 120)
+        self.assertEqual(rs.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertIsNone(rs.parse_retry_after('soon'))
+
+
+if __name__ == '__main__':
+    un.main()
@@ -0,0 +1,75 @@
+import unittest as un
+import time
+import numpy as np
+import word_generation as wn
+import vocabulary as vc
+from board import Board
+import spectator as sp
+
+
+class TestSpectator(un.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+        self.board = Board(5, 3, self.vocab)
+        self.server = sp.SpectatorServer(port=0)
+
+    def tearDown(self):
+        self.server.close()
+
+    def connect(self):
+        return sp.Spectator(port=self.server.port, timeout=5)
+
+    def wait_for(self, spectator, check):
+        """Receive until the check passes"""
+        deadline = time.monotonic() + 5
+        while not check(spectator.state):
+            self.assertLess(time.monotonic(), deadline)
+            self.assertTrue(spectator.receive())
+
+    def assert_same_board(self, state):
+        np.testing.assert_array_equal(state.words, self.board.words)
+        np.testing.assert_array_equal(state.counts, self.board.counts)
+        np.testing.assert_array_equal(state.limits, self.board.limits)
+
+    def test_round_trip(self):
+        """Test the messages rebuild the board without a socket"""
+        state = sp.BoardState()
+        reader = sp.MessageReader()
+        data = sp.encode_board(self.board, 0)
+        words = self.board.words.flatten()
+        article = self.vocab.count([words[0]] * 5 + [words[1]])
+        data += sp.encode_turn(self.board.apply_article(article), 1) + sp.encode_win(123)
+
+        # Split the stream at awkward places
+        for i in range(0, len(data), 7):
+            for kind, payload in reader.feed(data[i:i + 7]):
+                state.apply(kind, payload)
+        self.assert_same_board(state)
+        self.assertEqual((state.score, state.final_score), (1, 123))
+
+    def test_live(self):
+        """Test spectators get a snapshot and then follow the changes"""
+        self.server.publish_board(self.board, 0)
+        early = self.connect()
+        self.wait_for(early, lambda state: state.words is not None)
+        self.assert_same_board(early.state)
+
+        words = self.board.words.flatten()
+        article = self.vocab.count([words[0]] * 5 + [words[1]])
+        self.server.publish_turn(self.board.apply_article(article), 1)
+        self.wait_for(early, lambda state: state.score == 1)
+        self.assert_same_board(early.state)
+
+        late = self.connect()
+        self.wait_for(late, lambda state: state.words is not None)
+        self.assert_same_board(late.state)
+        self.assertEqual(late.state.score, 1)
+
+        early.close()
+        late.close()
+
+
+if __name__ == '__main__':
+    un.main()
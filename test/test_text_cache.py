@@ -0,0 +1,39 @@
+import unittest as un
+import pygame
+import text_cache as tc
+
+pygame.font.init()
+
+class TestTextCache(un.TestCase):
+
+    def setUp(self):
+        self.font = pygame.font.Font(None, 20)
+        self.cache = tc.TextCache(max_size=2)
+
+    def test_hit(self):
+        """Test repeated text reuses the surface"""
+        first = self.cache.render(self.font, 'COUNT: 1', True, (0, 0, 0), (255, 255, 255))
+        second = self.cache.render(self.font, 'COUNT: 1', True, (0, 0, 0), (255, 255, 255))
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_key(self):
+        """Test colours and background are part of the key"""
+        first = self.cache.render(self.font, 'word', True, (0, 0, 0))
+        second = self.cache.render(self.font, 'word', True, (0, 0, 0), (255, 255, 255))
+        self.assertIsNot(first, second)
+
+    def test_eviction(self):
+        """Test the least recently used surface is dropped"""
+        self.cache.render(self.font, 'a', True, (0, 0, 0))
+        self.cache.render(self.font, 'b', True, (0, 0, 0))
+        self.cache.render(self.font, 'a', True, (0, 0, 0))
+        self.cache.render(self.font, 'c', True, (0, 0, 0))
+        self.assertEqual(self.cache.stats()['size'], 2)
+        self.cache.render(self.font, 'a', True, (0, 0, 0))
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+
+if __name__ == '__main__':
+    un.main()
@@ -2,6 +2,8 @@ import unittest as un
 import word_generation as wn
 import numpy as np
 import validate_numbers as vn
+import bs4
+from unittest import mock
 
 class TestValidation(un.TestCase):
 
@@ -16,6 +18,22 @@ class TestValidation(un.TestCase):
         val.scrape_wiki()
         val.process_wiki()
 
+    def test_get_links(self):
+        """Test finding the most linked articles"""
+        page = bs4.BeautifulSoup('<a href="/wiki/Water">w</a><a href="/wiki/Help:Contents">h</a>'
+                                 '<a href="/wiki/Snow_cover#top">s</a><a href="/wiki/Water">w</a>'
+                                 '<a href="https://example.com">e</a>', 'html.parser')
+        self.assertEqual(vn.get_links(page), ['Water', 'Snow cover'])
+
+    def test_quoted_url(self):
+        """Test titles are escaped in the page URL"""
+        urls = []
+        with mock.patch.object(vn, 'fetch_url', lambda url, deadline=None: urls.append(url) or b'<p>x</p>'):
+            vn.Validation('São Paulo').scrape_wiki()
+            vn.Validation('What? (film)#Plot').scrape_wiki()
+        self.assertEqual(urls, ['https://en.wikipedia.org/wiki/S%C3%A3o_Paulo',
+                                'https://en.wikipedia.org/wiki/What%3F_%28film%29%23Plot'])
+
 
 if __name__ == '__main__':
     un.main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import unittest as un
+import pygame
+import viewport as vp
+
+AREA = (250, 60, 1500, 660)
+WINDOW = (1920, 800)
+TILE = (200, 80)
+
+class TestViewport(un.TestCase):
+
+    def test_small_board(self):
+        """Test small boards are centred as before and fully visible"""
+        view = vp.Viewport(5, AREA, WINDOW, TILE)
+        self.assertTrue(view.fits())
+        xmargin = int((1920 - (200 * 5 + 4)) / 2)
+        ymargin = int((800 - (80 * 5 + 4)) / 2)
+        self.assertEqual(view.tile_position(2, 3), (xmargin + 2 * 200 + 1, ymargin + 3 * 80 + 2))
+        self.assertEqual(view.visible_tiles(), (range(0, 5), range(0, 5)))
+
+    def test_large_board(self):
+        """Test only the tiles in the area are visible, and scrolling moves them"""
+        view = vp.Viewport(50, AREA, WINDOW, TILE)
+        self.assertFalse(view.fits())
+        xs, ys = view.visible_tiles()
+        self.assertEqual((xs.start, len(xs)), (0, 8))
+        self.assertEqual((ys.start, len(ys)), (0, 9))
+
+        view.scroll(201 * 10, 81 * 20)
+        xs, ys = view.visible_tiles()
+        self.assertEqual((xs.start, ys.start), (10, 20))
+
+        view.scroll(10 ** 6, -10 ** 6)
+        xs, ys = view.visible_tiles()
+        self.assertEqual((xs.stop, ys.start), (50, 0))
+
+    def test_zoom(self):
+        """Test zooming out is limited to the whole board fitting"""
+        view = vp.Viewport(20, AREA, WINDOW, TILE)
+        view.zoom_at(0.001, (500, 300))
+        self.assertTrue(view.fits())
+        self.assertEqual(view.visible_tiles(), (range(0, 20), range(0, 20)))
+        view.zoom_at(1000, (500, 300))
+        self.assertEqual(view.zoom, vp.MAX_ZOOM)
+
+    def test_atlas(self):
+        """Test tiles are only rendered once, within the byte limit"""
+        tile_bytes = pygame.Surface((10, 10), 0, 32).get_pitch() * 10
+        atlas = vp.TileAtlas(max_bytes=2 * tile_bytes)
+        calls = []
+
+        def render(key):
+            return lambda: calls.append(key) or pygame.Surface((10, 10), 0, 32)
+
+        for key in 'aabac':
+            atlas.get(key, render(key))
+        self.assertEqual(calls, ['a', 'b', 'c'])
+        self.assertEqual(list(atlas.surfaces), ['a', 'c'])
+        self.assertEqual(atlas.bytes, 2 * tile_bytes)
+
+    def test_zoom_clears_atlas(self):
+        """Test tiles at the old size are dropped on zooming, and small tiles skip the text"""
+        view = vp.Viewport(50, AREA, WINDOW, TILE)
+        view.atlas.get('a', lambda: pygame.Surface(TILE))
+        view.zoom_at(0.5, (500, 300))
+        self.assertEqual(len(view.atlas.surfaces), 0)
+        self.assertTrue(view.detailed())
+        view.zoom_at(0.001, (500, 300))
+        self.assertFalse(view.detailed())
+
+
+if __name__ == '__main__':
+    un.main()
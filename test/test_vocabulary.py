@@ -0,0 +1,64 @@
+import unittest as un
+import numpy as np
+import word_generation as wn
+import vocabulary as vc
+import board as bd
+
+class TestVocabulary(un.TestCase):
+
+    def setUp(self):
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+
+    def test_interning(self):
+        """Test words get unique IDs and the empty entry is dropped"""
+        self.assertEqual(len(self.vocab), 9367)
+        self.assertEqual(self.vocab.words[self.vocab.word_id('Germany')], 'germany')
+        self.assertFalse('' in self.vocab)
+
+    def test_count(self):
+        """Test counting tokens into a sparse array"""
+        article = self.vocab.count(['Germany', 'germany', 'the', 'xyzzy', 'music'])
+        self.assertEqual(len(article), 2)
+        ids = [self.vocab.word_id('germany'), self.vocab.word_id('music'),
+               self.vocab.word_id('poison')]
+        np.testing.assert_array_equal(article.lookup(ids), [2, 1, 0])
+
+    def test_empty_lookup(self):
+        """Test an article with no vocabulary words"""
+        article = self.vocab.count(['xyzzy'])
+        np.testing.assert_array_equal(article.lookup(np.zeros((2, 2))), np.zeros((2, 2)))
+
+
+class TestBoard(un.TestCase):
+
+    def setUp(self):
+        self.vocab = vc.Vocabulary(wn.get_word_list('no_stop_g2.txt'))
+        self.board = bd.Board(3, 3, self.vocab)
+
+    def test_unique_words(self):
+        """Test the starting board has no repeated words"""
+        self.assertEqual(len(set(self.board.words.flatten())), 9)
+
+    def test_apply_article(self):
+        """Test counts are added and overflowed words replaced"""
+        words = self.board.words
+        tokens = [words[0, 0]] * 2 + [words[1, 2]] * 5
+        updates = self.board.apply_article(self.vocab.count(tokens))
+
+        self.assertEqual([(u.x, u.y, u.added) for u in updates], [(1, 2, 5), (0, 0, 2)])
+        self.assertEqual(self.board.counts[0, 0], 2)
+        self.assertEqual(self.board.counts[1, 2], 0)
+        self.assertTrue(self.board.new[1, 2])
+        self.assertEqual(self.board.words[1, 2], updates[0].new_word)
+        self.assertIsNone(updates[1].new_word)
+        self.assertEqual(len(set(self.board.words.flatten())), 9)
+
+    def test_game_won(self):
+        """Test a full column wins"""
+        self.assertFalse(self.board.game_won())
+        self.board.counts[1, :] = 1
+        self.assertTrue(self.board.game_won())
+
+
+if __name__ == '__main__':
+    un.main()
@@ -0,0 +1,59 @@
+import unittest as un
+import io
+import tempfile
+from unittest import mock
+import request_scheduler as rs
+import warm_cache as wc
+
+
+class TestWarmCache(un.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.scheduler = rs.SCHEDULER
+        self.fetched = []
+
+    def tearDown(self):
+        rs.SCHEDULER = self.scheduler
+        self.dir.cleanup()
+
+    def fake_fetch(self, title, vocabulary, store=None, mode_choice=0, refresh=False):
+        self.fetched.append(title)
+        if title == 'missing':
+            raise ValueError('Article not found')
+        article = vocabulary.count(['germany', 'music'])
+        store.put(title, article, mode_choice)
+        return article
+
+    def warm(self, titles, max_age=None):
+        with mock.patch.object(wc, 'fetch_article', self.fake_fetch):
+            return wc.warm(titles, self.dir.name, workers=0, max_age=max_age,
+                           match_inflections=False, out=io.StringIO())
+
+    def test_warm(self):
+        """Test titles are fetched into the store and failures reported"""
+        counts, failures = self.warm(['Germany', 'missing', 'Music'])
+        self.assertEqual(counts, {'fetched': 2, 'fresh': 0, 'failed': 1})
+        self.assertEqual(failures, [('missing', 'ValueError: Article not found')])
+        self.assertIsNotNone(wc.WORKER['store'].get('germany'))
+
+    def test_resume(self):
+        """Test stored titles are skipped unless they are too old"""
+        self.warm(['Germany', 'Music'])
+        self.fetched = []
+        counts, _ = self.warm(['Germany', 'Music', 'Ice'])
+        self.assertEqual(counts['fresh'], 2)
+        self.assertEqual(self.fetched, ['Ice'])
+
+        counts, _ = self.warm(['Germany'], max_age=0)
+        self.assertEqual(counts['fetched'], 1)
+
+    def test_read_titles(self):
+        """Test blank and repeated titles are dropped"""
+        with open(self.dir.name + '/titles.txt', 'w') as f:
+            f.write('Germany\n\nMusic\nGermany\n')
+        self.assertEqual(wc.read_titles(self.dir.name + '/titles.txt'), ['Germany', 'Music'])
+
+
+if __name__ == '__main__':
+    un.main()
@@ -0,0 +1,61 @@
+"""A shared LRU cache of rendered text surfaces."""
+
+from collections import OrderedDict
+
+
+class TextCache(object):
+    """Cache the Surfaces returned by Font.render.
+
+    Surfaces are shared between callers, so anything that draws onto a
+    rendered surface must take a copy first.
+    """
+
+    def __init__(self, max_size=1024):
+        """Initialise the parameters"""
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Render some text, reusing an earlier surface if possible."""
+        key = (text, font, tuple(color), tuple(background) if background else None, antialias)
+        try:
+            surface = self.surfaces[key]
+        except KeyError:
+            self.misses += 1
+            if background is None:
+                surface = font.render(text, antialias, color)
+            else:
+                surface = font.render(text, antialias, color, background)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        """Empty the cache and reset the stats."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Get the cache hit/miss stats."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.surfaces),
+                'max_size': self.max_size,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                }
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Render text through the shared cache."""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
@@ -1,7 +1,31 @@
-import urllib.request as un
-from bs4 import BeautifulSoup as bs
+import urllib.parse as up
 import re
-import nltk
+from collections import Counter
+from lazy_import import LazyModule
+from request_scheduler import fetch_url
+
+bs4 = LazyModule('bs4')
+nltk = LazyModule('nltk')
+# Only loaded when a page is actually fetched.
+
+MAX_LINKS = 50
+# Most linked articles to keep from each page.
+
+
+def get_links(read_page, max_links=MAX_LINKS):
+    """Get the titles of the articles a page links to, most linked first"""
+    counter = Counter()
+    for link in read_page.find_all('a', href=True):
+        href = link['href']
+        if not href.startswith('/wiki/'):
+            continue
+        title = up.unquote(href[len('/wiki/'):].split('#')[0])
+        if title and ':' not in title and title != 'Main_Page':
+            counter[title.replace('_', ' ')] += 1
+        # Skip other namespaces (File:, Help: etc) and the main page.
+
+    return [title for title, _ in counter.most_common(max_links)]
+
 
 class Validation:
     """Validate word lengths"""
@@ -13,8 +37,10 @@ class Validation:
         self.title = page_title
         self.raw_title = page_title
         self.token = None
+        self.links = None
+        self.page_bytes = 0
 
-    def scrape_wiki(self, mode_choice=0):
+    def scrape_wiki(self, mode_choice=0, deadline=None):
         """Get text from Wikipedia page"""
 
         self.title = self.title.replace(' ', '_')
@@ -24,12 +50,17 @@ class Validation:
                  'https://simple.wikipedia.org/wiki/']
         # Simple english and normal mode.
 
-        url = modes[mode_choice]+self.title
-        web_data = un.urlopen(url)
-        read_page = bs(web_data.read(), 'html.parser')
+        url = modes[mode_choice]+up.quote(self.title)
+        # Escape non-ASCII letters and ? or # in the title.
+        web_data = fetch_url(url, deadline)
+        # Rate limited and retried, see request_scheduler.
+        self.page_bytes = len(web_data)
+        read_page = bs4.BeautifulSoup(web_data, 'html.parser')
         text = read_page.get_text()
         # Get parsed text in html.
 
+        self.links = get_links(read_page)
+
         self.page_text = text
 
     def process_wiki(self):
@@ -44,4 +75,15 @@ class Validation:
         tokens = nltk.word_tokenize(self.stripped_text)
         self.token = tokens
 
+    def count_words(self, vocabulary):
+        """Reduce the tokens to vocabulary word counts and free the page text"""
+        counts = vocabulary.count(self.token)
+        counts.links = tuple(self.links or ())
+        counts.page_bytes = self.page_bytes
+
+        self.page_text = None
+        self.stripped_text = None
+        self.token = None
+        # Only the sparse counts are needed from here on.
 
+        return counts
@@ -0,0 +1,177 @@
+"""A scrollable, zoomable view of the board, so only the visible tiles are drawn."""
+
+import math
+from collections import OrderedDict
+
+import pygame
+import pygame.locals as loc
+
+MAX_ZOOM = 2.0
+ZOOM_STEP = 1.25
+# Below this zoom the text is too small to read, so tiles are drawn as plain colour
+DETAIL_ZOOM = 0.4
+
+
+class TileAtlas(object):
+    """Rendered tile surfaces, reused until the tile (or the zoom) changes.
+
+    Limited to max_bytes of pixels, dropping the least recently drawn tiles.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """Initialise the parameters"""
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+
+    def get(self, key, render):
+        """Get the surface for a tile, calling render() to make it if needed."""
+        try:
+            self.surfaces.move_to_end(key)
+            return self.surfaces[key]
+        except KeyError:
+            surface = self.surfaces[key] = render()
+            self.bytes += surface.get_pitch() * surface.get_height()
+            while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+                _, old = self.surfaces.popitem(last=False)
+                self.bytes -= old.get_pitch() * old.get_height()
+            return surface
+
+    def clear(self):
+        """Drop all the surfaces (e.g. when the tile size changes)."""
+        self.surfaces.clear()
+        self.bytes = 0
+
+
+class Viewport(object):
+    """The part of the board shown on the screen.
+
+    Boards that fit in the area are centred on the window as they always
+    were. Bigger boards are clipped to the area and can be scrolled (mouse
+    wheel, shift + wheel or dragging with the right button) and zoomed
+    (ctrl + wheel).
+    """
+
+    def __init__(self, board_size, area, window_size, tile_size):
+        """Initialise the parameters"""
+        self.board_size = board_size
+        self.area = pygame.Rect(area)
+        self.window_size = window_size
+        self.base_tile_size = tile_size
+
+        self.zoom = 1.0
+        # Zoom out no further than the whole board fitting in the area
+        self.min_zoom = min(1.0,
+                            self.area.width / (board_size * (tile_size[0] + 1)),
+                            self.area.height / (board_size * (tile_size[1] + 1)))
+        # Board pixel at the top left of the area (when scrolling)
+        self.offset = [0, 0]
+
+        self.atlas = TileAtlas()
+
+    @property
+    def tile_size(self):
+        """Width and height of a tile at the current zoom."""
+        return (max(int(self.base_tile_size[0] * self.zoom), 1),
+                max(int(self.base_tile_size[1] * self.zoom), 1))
+
+    @property
+    def pitch(self):
+        """Distance between tiles (they have a 1 pixel gap)."""
+        width, height = self.tile_size
+        return (width + 1, height + 1)
+
+    def detailed(self):
+        """Check if tiles are big enough to draw their text."""
+        return self.zoom >= DETAIL_ZOOM
+
+    def board_pixels(self):
+        """Size of the whole board on the screen."""
+        width, height = self.tile_size
+        return (width * self.board_size + self.board_size - 1,
+                height * self.board_size + self.board_size - 1)
+
+    def fits(self):
+        """Check if the whole board fits in the area."""
+        width, height = self.board_pixels()
+        return width <= self.area.width and height <= self.area.height
+
+    def origin(self):
+        """Screen position of the top left courner of tile (0, 0)."""
+        width, height = self.board_pixels()
+        if self.fits():
+            left = int((self.window_size[0] - width) / 2) - 1
+            top = int((self.window_size[1] - height) / 2) - 1
+            # Keep clear of the messages and buttons around the area
+            left = min(max(left, self.area.left), self.area.right - width)
+            top = min(max(top, self.area.top), self.area.bottom - height)
+            return (left, top)
+        return (self.area.left - self.offset[0], self.area.top - self.offset[1])
+
+    def board_rect(self):
+        """The screen area covered by the visible part of the board."""
+        left, top = self.origin()
+        width, height = self.board_pixels()
+        return pygame.Rect(left, top, width, height).clip(self.area)
+
+    def tile_position(self, tilex, tiley):
+        """Screen position of the top left courner of a tile."""
+        left, top = self.origin()
+        pitchx, pitchy = self.pitch
+        return (left + tilex * pitchx, top + tiley * pitchy)
+
+    def visible_tiles(self):
+        """Get the ranges of tile x and y coordinates that are at least partly visible."""
+        left, top = self.origin()
+        pitchx, pitchy = self.pitch
+        xs = range(max(0, (self.area.left - left) // pitchx),
+                   min(self.board_size, math.ceil((self.area.right - left) / pitchx)))
+        ys = range(max(0, (self.area.top - top) // pitchy),
+                   min(self.board_size, math.ceil((self.area.bottom - top) / pitchy)))
+        return xs, ys
+
+    def scroll(self, dx, dy):
+        """Move the view by some screen pixels."""
+        self.offset[0] += dx
+        self.offset[1] += dy
+        self.clamp()
+
+    def zoom_at(self, factor, pos):
+        """Zoom in or out, keeping the board under pos in place."""
+        left, top = self.origin()
+        pitchx, pitchy = self.pitch
+        tilex = (pos[0] - left) / pitchx
+        tiley = (pos[1] - top) / pitchy
+        old_size = self.tile_size
+
+        self.zoom = min(max(self.zoom * factor, self.min_zoom), MAX_ZOOM)
+        if self.tile_size != old_size:
+            # Tiles at the old size won't be drawn again
+            self.atlas.clear()
+
+        pitchx, pitchy = self.pitch
+        self.offset = [tilex * pitchx - (pos[0] - self.area.left),
+                       tiley * pitchy - (pos[1] - self.area.top)]
+        self.clamp()
+
+    def clamp(self):
+        """Keep the view on the board."""
+        width, height = self.board_pixels()
+        self.offset[0] = int(min(max(self.offset[0], 0), max(width - self.area.width, 0)))
+        self.offset[1] = int(min(max(self.offset[1], 0), max(height - self.area.height, 0)))
+
+    def handle_event(self, event):
+        """Scroll or zoom for mouse wheel and drag events, returning True if it moved."""
+        if event.type == loc.MOUSEWHEEL:
+            mods = pygame.key.get_mods()
+            if mods & loc.KMOD_CTRL:
+                self.zoom_at(ZOOM_STEP ** event.y, pygame.mouse.get_pos())
+            elif mods & loc.KMOD_SHIFT:
+                self.scroll(-event.y * self.pitch[0], 0)
+            else:
+                self.scroll(-event.x * self.pitch[0], -event.y * self.pitch[1])
+            return True
+        if event.type == loc.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+            self.scroll(-event.rel[0], -event.rel[1])
+            return True
+        return False
@@ -0,0 +1,108 @@
+"""Integer IDs for the game vocabulary and per-article word counts."""
+
+from inflections import load_index
+
+from lazy_import import LazyModule
+
+from word_generation import get_word_list
+
+np = LazyModule('numpy')
+
+# The word list has ~10,000 entries, so IDs fit comfortably in 16 bits.
+ID_DTYPE = 'uint16'
+COUNT_DTYPE = 'uint32'
+
+
+class Vocabulary(object):
+    """Intern the words from the word list as compact integer IDs."""
+
+    def __init__(self, words, inflections=None):
+        """Initialise the parameters (inflections maps extra forms to words in the list)"""
+        self.words = []
+        self.ids = {}
+        for word in words:
+            word = word.lower()
+            if word and word not in self.ids:
+                self.ids[word] = len(self.words)
+                self.words.append(word)
+
+        if len(self.words) > np.iinfo(ID_DTYPE).max:
+            raise ValueError('Too many words for {}: {}'.format(ID_DTYPE, len(self.words)))
+
+        # Object array so a whole grid of IDs can be turned back into words at once.
+        self.word_array = np.array(self.words, dtype=object)
+
+        # Each token maps to the IDs it counts towards: its own entry and/or
+        # the word it is an inflection of (so "countries" also counts for "country").
+        self.inflections = {}
+        self.lookup = {word: (word_id,) for word, word_id in self.ids.items()}
+        for form, word in (inflections or {}).items():
+            if word in self.ids and form != word:
+                self.inflections[form] = word
+                self.lookup[form] = self.lookup.get(form, ()) + (self.ids[word],)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word.lower() in self.ids
+
+    def word_id(self, word):
+        """Get the ID of a word."""
+        return self.ids[word.lower()]
+
+    def encode(self, tokens):
+        """Convert tokens to an array of IDs, dropping any not in the vocabulary."""
+        lookup = self.lookup
+        return np.fromiter((word_id
+                            for token in tokens
+                            for word_id in lookup.get(token.lower(), ())),
+                           dtype=ID_DTYPE)
+
+    def count(self, tokens):
+        """Count the vocabulary words in a list of tokens."""
+        return ArticleCounts.from_ids(self.encode(tokens), len(self))
+
+
+def load_vocabulary(match_inflections=True):
+    """Load the game's word list, and the inflection index if wanted."""
+    inflections = load_index() if match_inflections else None
+    return Vocabulary(get_word_list('no_stop_g2.txt'), inflections)
+
+
+class ArticleCounts(object):
+    """Sparse word ID -> count array for a single article."""
+
+    def __init__(self, ids, counts, links=()):
+        """Initialise the parameters (ids must be sorted and unique)"""
+        self.ids = np.asarray(ids, dtype=ID_DTYPE)
+        self.counts = np.asarray(counts, dtype=COUNT_DTYPE)
+
+        # Titles the article links to, and its size when it was downloaded
+        self.links = tuple(links)
+        self.page_bytes = 0
+
+    @classmethod
+    def from_ids(cls, ids, size):
+        """Build the counts from an array of (repeated) word IDs."""
+        dense = np.bincount(ids, minlength=size)
+        present = np.flatnonzero(dense)
+        return cls(present, dense[present])
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def nbytes(self):
+        """Memory used by the count arrays."""
+        return self.ids.nbytes + self.counts.nbytes
+
+    def lookup(self, ids):
+        """Gather the counts for an array of word IDs (zero where absent)."""
+        ids = np.asarray(ids, dtype=ID_DTYPE)
+        if len(self.ids) == 0:
+            return np.zeros(ids.shape, dtype=COUNT_DTYPE)
+
+        positions = np.minimum(np.searchsorted(self.ids, ids), len(self.ids) - 1)
+        found = self.ids[positions] == ids
+        return np.where(found, self.counts[positions], 0).astype(COUNT_DTYPE)
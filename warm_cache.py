@@ -0,0 +1,124 @@
+"""Preload the article store before an event.
+
+    python warm_cache.py [titles.txt] [--workers 8] [--rate 10] [--max-age 7]
+
+Titles are read one per line (by default every word in the word list is
+tried as a title). Articles are fetched and processed through the same
+pipeline as the game, in parallel worker processes, and written to the
+article store. Anything already stored and fresh is skipped, so an
+interrupted run can just be started again.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from article_store import STORE_PATH, WORKER, fetch_article, init_worker
+from word_generation import get_word_list
+
+
+def read_titles(file_name=None):
+    """Read the titles to warm (the word list if no file is given)."""
+    if file_name is None:
+        titles = get_word_list('no_stop_g2.txt')
+    else:
+        with open(file_name) as f:
+            titles = f.read().split('\n')
+
+    # Drop blanks and repeats, keeping the order
+    return list(dict.fromkeys(title.strip() for title in titles if title.strip()))
+
+
+def warm_title(title, max_age=None):
+    """Fetch one title into the store, returning (title, status, error)."""
+    store = WORKER['store']
+    age = store.age(title)
+    if age is not None and (max_age is None or age < max_age):
+        return title, 'fresh', None
+
+    try:
+        fetch_article(title, WORKER['vocabulary'], store, refresh=True)
+    except Exception as error:
+        return title, 'failed', '{}: {}'.format(type(error).__name__, error)
+    if store.age(title) is None:
+        # fetch_article still returns the article if it couldn't be stored
+        return title, 'failed', 'Could not write it to the store'
+    return title, 'fetched', None
+
+
+def warm(titles, store_path=STORE_PATH, workers=8, rate=10.0, max_age=None,
+         match_inflections=True, report_every=100, out=sys.stdout):
+    """Warm the store for a list of titles, returning the counts and failures.
+
+    With workers=0 everything runs in this process.
+    """
+    counts = {'fetched': 0, 'fresh': 0, 'failed': 0}
+    failures = []
+    start = time.monotonic()
+
+    def report(done):
+        elapsed = time.monotonic() - start
+        print('{}/{} titles in {:.0f}s ({:.1f}/s): {fetched} fetched, {fresh} fresh, '
+              '{failed} failed'.format(done, len(titles), elapsed,
+                                       done / elapsed if elapsed else 0.0, **counts),
+              file=out, flush=True)
+
+    if workers:
+        executor = ProcessPoolExecutor(workers, initializer=init_worker,
+                                       initargs=(store_path, match_inflections, rate / workers))
+        results = executor.map(warm_title, titles, [max_age] * len(titles), chunksize=4)
+    else:
+        executor = None
+        init_worker(store_path, match_inflections, rate)
+        results = (warm_title(title, max_age) for title in titles)
+
+    try:
+        for done, (title, status, error) in enumerate(results, 1):
+            counts[status] += 1
+            if error:
+                failures.append((title, error))
+            if done % report_every == 0:
+                report(done)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    report(len(titles))
+    return counts, failures
+
+
+def main():
+    """Run the main process."""
+    parser = argparse.ArgumentParser(description='Preload articles into the article store')
+    parser.add_argument('titles', nargs='?',
+                        help='file of titles, one per line (default: the word list)')
+    parser.add_argument('--store', default=STORE_PATH, help='article store directory')
+    parser.add_argument('--workers', type=int, default=8, help='worker processes')
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='total requests per second to Wikipedia')
+    parser.add_argument('--max-age', type=float,
+                        help='refetch articles stored more than this many days ago')
+    parser.add_argument('--exact', action='store_true',
+                        help='for games run without inflection matching')
+    parser.add_argument('--failures', help='write the failed titles to this file')
+    args = parser.parse_args()
+
+    titles = read_titles(args.titles)
+    max_age = args.max_age * 24 * 60 * 60 if args.max_age is not None else None
+    counts, failures = warm(titles, args.store, args.workers, args.rate, max_age,
+                            not args.exact)
+
+    if args.failures:
+        with open(args.failures, 'w') as f:
+            for title, error in failures:
+                f.write('{}\t{}\n'.format(title, error))
+    elif failures:
+        for title, error in failures[:20]:
+            print('  {}: {}'.format(title, error))
+        if len(failures) > 20:
+            print('  ... and {} more (use --failures to save them all)'.format(len(failures) - 20))
+
+
+if __name__ == '__main__':
+    main()
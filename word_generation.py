@@ -1,5 +1,6 @@
-import numpy.random as rn
-import numpy as np
+from lazy_import import LazyModule
+
+rn = LazyModule('numpy.random')
 
 
 def get_word_list(file_name):
@@ -16,16 +17,18 @@ class TargetWord:
     Generate a target word and score range.
     """
 
-    def __init__(self, word_list):
+    def __init__(self, word_list, rng=None):
         """Initialise the parameters"""
         self.word = None
         self.upper = None
         self.word_list = word_list
+        # numpy RandomState to draw from (the global one by default)
+        self.rng = rn if rng is None else rng
 
     def word_gen(self):
         """Generate word from dictionary"""
 
-        selected_int = rn.randint(0, high=len(self.word_list))
+        selected_int = self.rng.randint(0, high=len(self.word_list))
         selected_word = self.word_list[selected_int]
 
         self.word = selected_word